@@ -9,7 +9,9 @@ Handles burner sizing calculations, pressure requirements, and flow calculations
 
 import math
 from dataclasses import dataclass
-from typing import Dict
+from typing import Dict, Sequence, Union
+
+import numpy as np
 
 try:
     from .combustion import CombustionCalculator
@@ -17,7 +19,7 @@ except ImportError:
     from combustion import CombustionCalculator
 
 
-@dataclass
+@dataclass(frozen=True)
 class BurnerDesignResults:
     """
     Data class containing results of burner design calculations.
@@ -42,6 +44,105 @@ class BurnerDesignResults:
     burner_length: float
     flame_length: float
 
+    @classmethod
+    def to_arrays(
+        cls, results: Sequence["BurnerDesignResults"]
+    ) -> Dict[str, np.ndarray]:
+        """
+        Convert a sequence of design results into column arrays.
+
+        Args:
+            results (Sequence[BurnerDesignResults]): Results from a parameter sweep
+
+        Returns:
+            Dict[str, np.ndarray]: One float array per result field
+        """
+        return {
+            name: np.array([getattr(result, name) for result in results], dtype=float)
+            for name in cls.__dataclass_fields__
+        }
+
+
+def _ideal_gas_density(
+    pressure: float, molecular_weight: float, gas_constant: float, temperature: float
+) -> float:
+    """
+    Evaluate the ideal gas law for density.
+
+    Args:
+        pressure (float): Gas pressure [Pa]
+        molecular_weight (float): Molar mass [kg/mol]
+        gas_constant (float): Universal gas constant [J/(mol·K)]
+        temperature (float): Gas temperature [K]
+
+    Returns:
+        float: Gas density [kg/m³]
+    """
+    # ρ = (P * M) / (R * T)
+    return (pressure * molecular_weight) / (gas_constant * temperature)
+
+
+def _flame_length_correlation(
+    burner_diameter: Union[float, np.ndarray],
+    gas_velocity: Union[float, np.ndarray],
+    gas_density: float,
+    c_constant: float,
+    n_exponent: float,
+    viscosity: float,
+) -> Union[float, np.ndarray]:
+    """
+    Evaluate the turbulent diffusion flame length correlation L/D = C * Re^n.
+
+    Accepts scalars or NumPy arrays of equal shape.
+
+    Args:
+        burner_diameter (float or np.ndarray): Burner diameter [m]
+        gas_velocity (float or np.ndarray): Gas velocity [m/s]
+        gas_density (float): Fuel gas density [kg/m³]
+        c_constant (float): Empirical correlation constant [-]
+        n_exponent (float): Reynolds number exponent [-]
+        viscosity (float): Dynamic viscosity [Pa·s]
+
+    Returns:
+        float or np.ndarray: Flame length clamped to 5-50 burner diameters [m]
+    """
+    reynolds = gas_density * gas_velocity * burner_diameter / viscosity
+    flame_length = c_constant * (reynolds**n_exponent) * burner_diameter
+
+    # Apply reasonable limits
+    return np.minimum(
+        np.maximum(flame_length, burner_diameter * 5), burner_diameter * 50
+    )
+
+
+def _power_scaled_velocity(
+    base_velocity: float,
+    power: Union[float, np.ndarray],
+    min_velocity: float,
+    max_velocity: float,
+) -> Union[float, np.ndarray]:
+    """
+    Scale a fuel's base velocity with burner power and clamp it to the limits.
+
+    Accepts a scalar power or a NumPy array of powers.
+
+    Args:
+        base_velocity (float): Base velocity for the fuel [m/s]
+        power (float or np.ndarray): Required power [W]
+        min_velocity (float): Minimum allowed gas velocity [m/s]
+        max_velocity (float): Maximum allowed gas velocity [m/s]
+
+    Returns:
+        float or np.ndarray: Optimal gas velocity [m/s]
+    """
+    # Adjust velocity based on power (higher power -> higher velocity for mixing)
+    power_factor = np.minimum(2.0, (power / 100000) ** 0.3)  # Scale factor for power
+
+    optimal_velocity = base_velocity * power_factor
+
+    # Ensure within limits
+    return np.minimum(np.maximum(optimal_velocity, min_velocity), max_velocity)
+
 
 class BurnerDesigner:
     """
@@ -116,92 +217,176 @@ class BurnerDesigner:
         # Calculate required fuel flow rate
         fuel_flow_rate = required_power / fuel_props["lower_heating_value_mass"]
 
-        # Calculate combustion properties
         # Calculate combustion properties to get total gas flow
         combustion_results = self.combustion_calc.calculate_combustion_products(
             fuel_type, fuel_flow_rate, excess_air_ratio
         )
 
+        design = self._size_burners(
+            fuel_type,
+            required_power,
+            combustion_results.fuel_flow_rate,
+            combustion_results.air_flow_rate,
+            supply_pressure,
+            target_velocity,
+        )
+
+        return BurnerDesignResults(
+            **{name: float(value) for name, value in design.items()}
+        )
+
+    def design_burner_batch(
+        self,
+        fuel_type: str,
+        required_powers: Sequence[float],
+        supply_pressure: float,
+        target_velocity: float = None,
+        excess_air_ratio: float = 1.2,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Design burners for a sweep of power requirements in one pass.
+
+        Runs the same sizing as design_burner, with the combustion flows and
+        burner geometry evaluated as NumPy array operations over the sweep.
+
+        Args:
+            fuel_type (str): Type of fuel to be used
+            required_powers (Sequence[float]): Required thermal powers [W]
+            supply_pressure (float): Available gas supply pressure [Pa]
+            target_velocity (float, optional): Target gas velocity [m/s]
+            excess_air_ratio (float): Excess air ratio
+
+        Returns:
+            Dict[str, np.ndarray]: One array per BurnerDesignResults field,
+                ordered like required_powers
+
+        Raises:
+            ValueError: If design parameters are invalid or unfeasible
+        """
+        powers = np.asarray(required_powers, dtype=float)
+
+        if np.any(powers <= 0):
+            raise ValueError("Požadovaný výkon musí být větší než nula")
+
+        if supply_pressure <= 0:
+            raise ValueError("Tlak plynu musí být větší než nula")
+
+        # Get fuel properties
+        fuel_props = self.combustion_calc.get_fuel_properties(fuel_type)["properties"]
+
+        # Calculate required fuel flow rates and combustion products
+        fuel_flow_rates = powers / fuel_props["lower_heating_value_mass"]
+        combustion_results = self.combustion_calc.calculate_combustion_products_batch(
+            fuel_type, fuel_flow_rates, excess_air_ratio
+        )
+
+        return self._size_burners(
+            fuel_type,
+            powers,
+            combustion_results["fuel_flow_rate"],
+            combustion_results["air_flow_rate"],
+            supply_pressure,
+            target_velocity,
+        )
+
+    def _size_burners(
+        self,
+        fuel_type: str,
+        required_power: Union[float, np.ndarray],
+        fuel_flow_rate: Union[float, np.ndarray],
+        air_flow_rate: Union[float, np.ndarray],
+        supply_pressure: float,
+        target_velocity: float = None,
+    ) -> Dict[str, Union[float, np.ndarray]]:
+        """
+        Size burners from their power and combustion flows.
+
+        Shared by design_burner and design_burner_batch. Accepts scalars or
+        NumPy arrays of equal shape, so one operating point and a whole sweep
+        follow the same calculation.
+
+        Args:
+            fuel_type (str): Type of fuel to be used
+            required_power (float or np.ndarray): Required thermal power [W]
+            fuel_flow_rate (float or np.ndarray): Fuel mass flow rate [kg/s]
+            air_flow_rate (float or np.ndarray): Air mass flow rate [kg/s]
+            supply_pressure (float): Available gas supply pressure [Pa]
+            target_velocity (float, optional): Target gas velocity [m/s]
+
+        Returns:
+            Dict[str, float or np.ndarray]: Value per BurnerDesignResults field
+
+        Raises:
+            ValueError: If the supply pressure or heat release density limits
+                are exceeded
+        """
         # Calculate gas mixture density at operating conditions
         # For fuel-air mixture, we need weighted average density
         fuel_density = self._calculate_gas_density(fuel_type, supply_pressure, 293.15)
         air_density = 1.225  # kg/m³ at 20°C, 1 atm
 
         # Weighted average density based on mass fractions
-        total_mass = (
-            combustion_results.fuel_flow_rate + combustion_results.air_flow_rate
-        )
-        fuel_fraction = combustion_results.fuel_flow_rate / total_mass
-        air_fraction = combustion_results.air_flow_rate / total_mass
+        total_mass_flow_rate = fuel_flow_rate + air_flow_rate
+        gas_density = (
+            fuel_flow_rate * fuel_density + air_flow_rate * air_density
+        ) / total_mass_flow_rate
 
-        gas_density = fuel_fraction * fuel_density + air_fraction * air_density
-
-        # Calculate burner dimensions
+        # Gas velocity, clamped to the allowed range
         if target_velocity is None:
             target_velocity = self._calculate_optimal_velocity(
                 fuel_type, required_power
             )
-
-        # Validate velocity range
-        if target_velocity < self.MIN_GAS_VELOCITY:
-            target_velocity = self.MIN_GAS_VELOCITY
-        elif target_velocity > self.MAX_GAS_VELOCITY:
-            target_velocity = self.MAX_GAS_VELOCITY
-
-        # Calculate burner area and diameter based on total gas flow (fuel + air)
-        # Total mass flow rate = fuel + air
-        total_mass_flow_rate = (
-            combustion_results.fuel_flow_rate + combustion_results.air_flow_rate
+        else:
+            target_velocity = np.full(np.shape(required_power), float(target_velocity))
+        gas_velocity = np.minimum(
+            np.maximum(target_velocity, self.MIN_GAS_VELOCITY), self.MAX_GAS_VELOCITY
         )
 
-        # Calculate volume flow rate at burner conditions
+        # Calculate burner area and diameter from the volume flow at burner
+        # conditions of the total gas flow (fuel + air)
         volume_flow_rate = total_mass_flow_rate / gas_density
-        burner_area = volume_flow_rate / target_velocity
-        burner_diameter = math.sqrt(4 * burner_area / math.pi)
+        burner_area = volume_flow_rate / gas_velocity
+        burner_diameter = np.sqrt(4 * burner_area / math.pi)
 
         # Calculate pressure drop across burner
         burner_pressure_drop = self._calculate_burner_pressure_drop(
-            gas_density, target_velocity, burner_diameter
+            gas_density, gas_velocity, burner_diameter
         )
 
         # Calculate required supply pressure
         required_supply_pressure = burner_pressure_drop * self.safety_factor
 
-        if required_supply_pressure > supply_pressure:
+        if (required_supply_pressure > supply_pressure).any():
             raise ValueError(
                 f"Nedostatečný tlak plynu. "
-                f"Požadováno: {required_supply_pressure:.0f} Pa, "
+                f"Požadováno: {required_supply_pressure.max():.0f} Pa, "
                 f"k dispozici: {supply_pressure:.0f} Pa"
             )
 
         # Calculate heat release density
         heat_release_density = required_power / burner_area
 
-        if heat_release_density > self.MAX_HEAT_DENSITY:
+        if (heat_release_density > self.MAX_HEAT_DENSITY).any():
             raise ValueError(
                 f"Příliš vysoká hustota tepelného toku: "
-                f"{heat_release_density/1e6:.1f} MW/m². "
+                f"{heat_release_density.max()/1e6:.1f} MW/m². "
                 f"Maximum: {self.MAX_HEAT_DENSITY/1e6:.1f} MW/m²"
             )
 
-        # Calculate burner length (L/D ratio typically 2-4 for gas burners)
-        burner_length = burner_diameter * 3.0
-
-        # Estimate flame length
-        flame_length = self._calculate_flame_length(
-            burner_diameter, target_velocity, fuel_type
-        )
-
-        return BurnerDesignResults(
-            burner_diameter=burner_diameter,
-            burner_area=burner_area,
-            gas_velocity=target_velocity,
-            burner_pressure_drop=burner_pressure_drop,
-            required_supply_pressure=required_supply_pressure,
-            heat_release_density=heat_release_density,
-            burner_length=burner_length,
-            flame_length=flame_length,
-        )
+        return {
+            "burner_diameter": burner_diameter,
+            "burner_area": burner_area,
+            "gas_velocity": gas_velocity,
+            "burner_pressure_drop": burner_pressure_drop,
+            "required_supply_pressure": required_supply_pressure,
+            "heat_release_density": heat_release_density,
+            # Burner length (L/D ratio typically 2-4 for gas burners)
+            "burner_length": burner_diameter * 3.0,
+            # Estimated flame length
+            "flame_length": self._calculate_flame_length(
+                burner_diameter, gas_velocity, fuel_type
+            ),
+        }
 
     def _calculate_gas_density(
         self, fuel_type: str, pressure: float, temperature: float
@@ -220,25 +405,26 @@ class BurnerDesigner:
         fuel_props = self.combustion_calc.get_fuel_properties(fuel_type)["properties"]
         constants = self.combustion_calc.constants
 
-        # Using ideal gas law: ρ = (P * M) / (R * T)
-        # Convert g/mol to kg/mol
-        molecular_weight = fuel_props["molecular_weight"] / 1000
-        gas_constant = constants["universal_gas_constant"]
-
-        density = (pressure * molecular_weight) / (gas_constant * temperature)
-
-        return density
+        # Using ideal gas law, converting g/mol to kg/mol
+        return _ideal_gas_density(
+            pressure,
+            fuel_props["molecular_weight"] / 1000,
+            constants["universal_gas_constant"],
+            temperature,
+        )
 
-    def _calculate_optimal_velocity(self, fuel_type: str, power: float) -> float:
+    def _calculate_optimal_velocity(
+        self, fuel_type: str, power: Union[float, np.ndarray]
+    ) -> Union[float, np.ndarray]:
         """
         Calculate optimal gas velocity based on fuel type and power.
 
         Args:
             fuel_type (str): Type of fuel
-            power (float): Required power [W]
+            power (float or np.ndarray): Required power [W]
 
         Returns:
-            float: Optimal gas velocity [m/s]
+            float or np.ndarray: Optimal gas velocity [m/s], same shape as power
         """
         # Empirical correlation based on power and fuel type
         if fuel_type in ["natural_gas", "methane"]:
@@ -248,27 +434,29 @@ class BurnerDesigner:
         else:
             base_velocity = 20.0  # m/s
 
-        # Adjust velocity based on power (higher power -> higher velocity for mixing)
-        power_factor = min(2.0, (power / 100000) ** 0.3)  # Scale factor for power
-
-        optimal_velocity = base_velocity * power_factor
-
-        # Ensure within limits
-        return max(self.MIN_GAS_VELOCITY, min(self.MAX_GAS_VELOCITY, optimal_velocity))
+        return _power_scaled_velocity(
+            base_velocity, power, self.MIN_GAS_VELOCITY, self.MAX_GAS_VELOCITY
+        )
 
     def _calculate_burner_pressure_drop(
-        self, gas_density: float, velocity: float, diameter: float
-    ) -> float:
+        self,
+        gas_density: Union[float, np.ndarray],
+        velocity: Union[float, np.ndarray],
+        diameter: Union[float, np.ndarray],
+    ) -> Union[float, np.ndarray]:
         """
         Calculate pressure drop across the burner.
 
+        The formula is pure arithmetic, so arrays of densities and velocities
+        are evaluated element-wise in a single call.
+
         Args:
-            gas_density (float): Gas density [kg/m³]
-            velocity (float): Gas velocity [m/s]
-            diameter (float): Burner diameter [m]
+            gas_density (float or np.ndarray): Gas density [kg/m³]
+            velocity (float or np.ndarray): Gas velocity [m/s]
+            diameter (float or np.ndarray): Burner diameter [m]
 
         Returns:
-            float: Pressure drop [Pa]
+            float or np.ndarray: Pressure drop [Pa], same shape as velocity
         """
         # Using orifice pressure drop equation: ΔP = K * ρ * V² / 2
         # K factor includes discharge coefficient and geometry effects
@@ -279,18 +467,21 @@ class BurnerDesigner:
         return pressure_drop
 
     def _calculate_flame_length(
-        self, burner_diameter: float, gas_velocity: float, fuel_type: str
-    ) -> float:
+        self,
+        burner_diameter: Union[float, np.ndarray],
+        gas_velocity: Union[float, np.ndarray],
+        fuel_type: str,
+    ) -> Union[float, np.ndarray]:
         """
         Estimate flame length based on burner geometry and conditions.
 
         Args:
-            burner_diameter (float): Burner diameter [m]
-            gas_velocity (float): Gas velocity [m/s]
+            burner_diameter (float or np.ndarray): Burner diameter [m]
+            gas_velocity (float or np.ndarray): Gas velocity [m/s]
             fuel_type (str): Type of fuel
 
         Returns:
-            float: Estimated flame length [m]
+            float or np.ndarray: Estimated flame length [m]
         """
         # Empirical correlation for turbulent diffusion flames
         # L/D = C * Re^n where Re is Reynolds number
@@ -301,9 +492,6 @@ class BurnerDesigner:
         # Estimate viscosity (simplified)
         viscosity = 1.5e-5  # Pa·s, typical for gases at moderate temperature
 
-        # Calculate Reynolds number
-        reynolds = gas_density * gas_velocity * burner_diameter / viscosity
-
         # Empirical constants for flame length correlation
         if fuel_type in ["natural_gas", "methane"]:
             c_constant = 0.2
@@ -312,14 +500,14 @@ class BurnerDesigner:
             c_constant = 0.25
             n_exponent = 0.5
 
-        # Calculate flame length
-        flame_length = c_constant * (reynolds**n_exponent) * burner_diameter
-
-        # Apply reasonable limits
-        min_length = burner_diameter * 5
-        max_length = burner_diameter * 50
-
-        return max(min_length, min(max_length, flame_length))
+        return _flame_length_correlation(
+            burner_diameter,
+            gas_velocity,
+            gas_density,
+            c_constant,
+            n_exponent,
+            viscosity,
+        )
 
     def validate_design(self, design_results: BurnerDesignResults) -> Dict[str, bool]:
         """
@@ -9,7 +9,9 @@ Handles chamber volume calculations, heat transfer, residence time, and temperat
 
 import math
 from dataclasses import dataclass
-from typing import Dict, Tuple
+from typing import Dict, Sequence, Tuple, Union
+
+import numpy as np
 
 try:
     from .combustion import CombustionCalculator, CombustionResults
@@ -19,7 +21,7 @@ except ImportError:
     from burner_design import BurnerDesigner
 
 
-@dataclass
+@dataclass(frozen=True)
 class ChamberDesignResults:
     """
     Data class containing results of combustion chamber design calculations.
@@ -61,6 +63,166 @@ class ChamberDesignResults:
         return self.wall_temperature
 
 
+def _flue_gas_volume_flow(
+    flue_gas_flow_rate: Union[float, np.ndarray],
+    gas_temperature: Union[float, np.ndarray],
+    constants: Dict[str, float],
+) -> Union[float, np.ndarray]:
+    """
+    Convert flue gas mass flow to volumetric flow at operating temperature.
+
+    Accepts scalars or NumPy arrays of equal shape.
+
+    Args:
+        flue_gas_flow_rate (float or np.ndarray): Flue gas mass flow rate [kg/s]
+        gas_temperature (float or np.ndarray): Gas temperature [K]
+        constants (Dict[str, float]): Physical constants of the combustion calculator
+
+    Returns:
+        float or np.ndarray: Volumetric flow rate [m³/s]
+    """
+    # Using ideal gas law to convert mass flow to volume flow
+    # V̇ = (ṁ * R * T) / (P * M)
+    gas_constant = constants["universal_gas_constant"]
+    pressure = constants["standard_pressure"]  # Assume atmospheric pressure
+    molecular_weight = constants["air_molecular_weight"] / 1000  # kg/mol
+
+    return (flue_gas_flow_rate * gas_constant * gas_temperature) / (
+        pressure * molecular_weight
+    )
+
+
+def _heat_transfer_coefficient(
+    gas_temperature: Union[float, np.ndarray],
+    chamber_diameter: Union[float, np.ndarray],
+    mass_flow_rate: Union[float, np.ndarray],
+) -> Union[float, np.ndarray]:
+    """
+    Evaluate the gas-to-wall heat transfer correlation for a cylindrical chamber.
+
+    Accepts scalars or NumPy arrays of equal shape.
+
+    Args:
+        gas_temperature (float or np.ndarray): Average gas temperature [K]
+        chamber_diameter (float or np.ndarray): Chamber diameter [m]
+        mass_flow_rate (float or np.ndarray): Gas mass flow rate [kg/s]
+
+    Returns:
+        float or np.ndarray: Heat transfer coefficient [W/m²K]
+    """
+    # Simplified calculation based on empirical correlations
+    # For turbulent flow in cylindrical chambers
+
+    # Calculate Reynolds number (simplified)
+    gas_velocity = mass_flow_rate / (
+        1.0 * math.pi * chamber_diameter**2 / 4  # Assuming ρ ≈ 1 kg/m³ at high temp
+    )
+
+    reynolds = (
+        1.0 * gas_velocity * chamber_diameter / 2e-5
+    )  # ν ≈ 2e-5 m²/s for hot gases
+
+    # Nusselt number correlation for turbulent flow, laminar value below Re 2300
+    nusselt = np.where(
+        reynolds > 2300,
+        0.023 * (reynolds**0.8) * (0.7**0.4),  # Pr ≈ 0.7 for gases
+        3.66,
+    )
+
+    # Thermal conductivity of hot combustion gases
+    thermal_conductivity = 0.05 + (gas_temperature - 273.15) * 5e-5  # Empirical
+
+    # Heat transfer coefficient
+    h = nusselt * thermal_conductivity / chamber_diameter
+
+    return h
+
+
+# Wall construction shared by the wall temperature and heat loss kernels
+INSULATION_CONDUCTIVITY = 0.2  # W/mK, typical refractory material
+EXTERNAL_HEAT_TRANSFER_COEFFICIENT = 10.0  # W/m²K, natural convection + radiation
+
+
+def _wall_resistance(
+    insulation_thickness: Union[float, np.ndarray],
+) -> Union[float, np.ndarray]:
+    """
+    Evaluate the thermal resistance from the inner wall to ambient.
+
+    Args:
+        insulation_thickness (float or np.ndarray): Insulation thickness [m]
+
+    Returns:
+        float or np.ndarray: Insulation plus external film resistance [m²K/W]
+    """
+    return (
+        insulation_thickness / INSULATION_CONDUCTIVITY
+        + 1 / EXTERNAL_HEAT_TRANSFER_COEFFICIENT
+    )
+
+
+def _wall_temperature_and_heat_flux(
+    gas_temperature: Union[float, np.ndarray],
+    heat_transfer_coefficient: Union[float, np.ndarray],
+    insulation_thickness: Union[float, np.ndarray],
+    ambient_temperature: Union[float, np.ndarray],
+) -> Tuple[Union[float, np.ndarray], Union[float, np.ndarray]]:
+    """
+    Evaluate inner wall temperature and wall heat flux in one pass.
+
+    Both follow from the same series resistances (gas film, insulation and
+    external film), so the resistances are evaluated once. The wall heat loss
+    is the returned heat flux times the chamber surface area. Accepts scalars
+    or NumPy arrays of equal shape.
+
+    Args:
+        gas_temperature (float or np.ndarray): Gas temperature [K]
+        heat_transfer_coefficient (float or np.ndarray): Heat transfer coefficient [W/m²K]
+        insulation_thickness (float or np.ndarray): Insulation thickness [m]
+        ambient_temperature (float or np.ndarray): Ambient temperature [K]
+
+    Returns:
+        Tuple: Wall temperature [K] and heat flux [W/m²], each float or
+            np.ndarray
+    """
+    # Thermal resistances
+    r_convection = 1 / heat_transfer_coefficient
+    total_resistance = r_convection + _wall_resistance(insulation_thickness)
+
+    # Heat flux (assuming steady state)
+    heat_flux = (gas_temperature - ambient_temperature) / total_resistance
+
+    # Wall temperature (inner surface)
+    return gas_temperature - heat_flux * r_convection, heat_flux
+
+
+def _wall_heat_loss(
+    surface_area: Union[float, np.ndarray],
+    wall_temperature: Union[float, np.ndarray],
+    ambient_temperature: Union[float, np.ndarray],
+    insulation_thickness: Union[float, np.ndarray],
+) -> Union[float, np.ndarray]:
+    """
+    Evaluate heat loss from a given inner wall temperature to ambient.
+
+    Accepts scalars or NumPy arrays of equal shape.
+
+    Args:
+        surface_area (float or np.ndarray): Chamber surface area [m²]
+        wall_temperature (float or np.ndarray): Wall temperature [K]
+        ambient_temperature (float or np.ndarray): Ambient temperature [K]
+        insulation_thickness (float or np.ndarray): Insulation thickness [m]
+
+    Returns:
+        float or np.ndarray: Heat loss rate [W]
+    """
+    return (
+        surface_area
+        * (wall_temperature - ambient_temperature)
+        / _wall_resistance(insulation_thickness)
+    )
+
+
 class ChamberDesigner:
     """
     Designer for combustion chambers with thermal calculations.
@@ -154,80 +316,166 @@ class ChamberDesigner:
             fuel_type, fuel_flow_rate, 1.2  # 20% excess air
         )
 
-        # Calculate required chamber volume based on residence time
-        flue_gas_volume_flow = self._calculate_flue_gas_volume_flow(
-            combustion_results, combustion_results.adiabatic_flame_temperature
+        design = self._size_chambers(
+            required_power,
+            target_residence_time,
+            combustion_results.flue_gas_flow_rate,
+            combustion_results.adiabatic_flame_temperature,
+            wall_insulation_thickness,
+            ambient_temperature,
         )
 
-        chamber_volume = (
-            flue_gas_volume_flow * target_residence_time * self.safety_factor
+        if design["thermal_efficiency"] < target_efficiency * 100:
+            # Increase insulation thickness recommendation
+            pass  # This could trigger a warning or recommendation
+
+        # The sizing step is array-safe; keep scalar designs as plain Python floats
+        return ChamberDesignResults(
+            **{name: float(value) for name, value in design.items()}
         )
 
-        # Calculate chamber dimensions
-        chamber_diameter, chamber_length, chamber_area = (
-            self._calculate_chamber_dimensions(chamber_volume)
+    def design_chamber_batch(
+        self,
+        fuel_type: str,
+        required_powers: Sequence[float],
+        target_residence_times: Union[float, Sequence[float]] = 0.5,
+        wall_insulation_thickness: float = 0.1,
+        ambient_temperature: float = 293.15,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Design combustion chambers for a sweep of power requirements in one pass.
+
+        Applies the same method as design_chamber, with the sizing and thermal
+        calculations evaluated as NumPy array operations.
+
+        Args:
+            fuel_type (str): Type of fuel to be used
+            required_powers (Sequence[float]): Required thermal powers [W]
+            target_residence_times (float or Sequence[float]): Target gas
+                residence time, scalar or one per power [s]
+            wall_insulation_thickness (float): Wall insulation thickness [m]
+            ambient_temperature (float): Ambient temperature [K]
+
+        Returns:
+            Dict[str, np.ndarray]: One array per ChamberDesignResults field,
+                ordered like required_powers
+
+        Raises:
+            ValueError: If design parameters are invalid or unfeasible
+        """
+        powers = np.asarray(required_powers, dtype=float)
+        residence_times = np.broadcast_to(
+            np.asarray(target_residence_times, dtype=float), powers.shape
         )
 
-        # Calculate volume heat release rate
-        volume_heat_release_rate = required_power / chamber_volume
+        if np.any(powers <= 0):
+            raise ValueError("Požadovaný výkon musí být větší než nula")
+
+        if np.any(residence_times < self.MIN_RESIDENCE_TIME):
+            raise ValueError(
+                f"Doba zdržení je příliš krátká. Minimum: {self.MIN_RESIDENCE_TIME} s"
+            )
 
-        if volume_heat_release_rate > self.MAX_VOLUME_HEAT_RATE:
-            # Increase chamber size if heat release rate is too high
-            chamber_volume = required_power / self.MAX_VOLUME_HEAT_RATE
-            chamber_diameter, chamber_length, chamber_area = (
-                self._calculate_chamber_dimensions(chamber_volume)
+        if np.any(residence_times > self.MAX_RESIDENCE_TIME):
+            raise ValueError(
+                f"Doba zdržení je příliš dlouhá. Maximum: {self.MAX_RESIDENCE_TIME} s"
             )
-            volume_heat_release_rate = required_power / chamber_volume
 
-        # Calculate actual residence time with new dimensions
-        actual_residence_time = chamber_volume / flue_gas_volume_flow
+        # Get fuel properties and calculate combustion
+        fuel_props = self.combustion_calc.get_fuel_properties(fuel_type)["properties"]
+        fuel_flow_rates = powers / fuel_props["lower_heating_value_mass"]
 
-        # Calculate heat transfer and wall temperature
-        heat_transfer_coefficient = self._calculate_heat_transfer_coefficient(
-            combustion_results.adiabatic_flame_temperature,
-            chamber_diameter,
-            combustion_results.flue_gas_flow_rate,
+        combustion_results = self.combustion_calc.calculate_combustion_products_batch(
+            fuel_type, fuel_flow_rates, 1.2  # 20% excess air
         )
 
-        wall_temperature = self._calculate_wall_temperature(
-            combustion_results.adiabatic_flame_temperature,
-            heat_transfer_coefficient,
+        return self._size_chambers(
+            powers,
+            residence_times,
+            combustion_results["flue_gas_flow_rate"],
+            combustion_results["adiabatic_flame_temperature"],
             wall_insulation_thickness,
             ambient_temperature,
         )
 
-        # Calculate heat losses
-        chamber_surface_area = self._calculate_chamber_surface_area(
-            chamber_diameter, chamber_length
+    def _size_chambers(
+        self,
+        required_power: Union[float, np.ndarray],
+        target_residence_time: Union[float, np.ndarray],
+        flue_gas_flow_rate: Union[float, np.ndarray],
+        flame_temperature: Union[float, np.ndarray],
+        wall_insulation_thickness: float,
+        ambient_temperature: float,
+    ) -> Dict[str, Union[float, np.ndarray]]:
+        """
+        Size chambers and evaluate their thermal performance.
+
+        Shared by design_chamber and design_chamber_batch; accepts scalars or
+        NumPy arrays of equal shape.
+
+        Args:
+            required_power (float or np.ndarray): Required thermal power [W]
+            target_residence_time (float or np.ndarray): Target gas residence time [s]
+            flue_gas_flow_rate (float or np.ndarray): Flue gas mass flow rate [kg/s]
+            flame_temperature (float or np.ndarray): Adiabatic flame temperature [K]
+            wall_insulation_thickness (float): Wall insulation thickness [m]
+            ambient_temperature (float): Ambient temperature [K]
+
+        Returns:
+            Dict[str, float or np.ndarray]: One entry per ChamberDesignResults field
+        """
+        # Calculate required chamber volume based on residence time
+        flue_gas_volume_flow = _flue_gas_volume_flow(
+            flue_gas_flow_rate, flame_temperature, self.combustion_calc.constants
+        )
+        chamber_volume = (
+            flue_gas_volume_flow * target_residence_time * self.safety_factor
         )
 
-        heat_loss_rate = self._calculate_heat_loss(
-            chamber_surface_area,
-            wall_temperature,
-            ambient_temperature,
-            wall_insulation_thickness,
+        # Increase chamber size if heat release rate is too high
+        chamber_volume = np.where(
+            required_power / chamber_volume > self.MAX_VOLUME_HEAT_RATE,
+            required_power / self.MAX_VOLUME_HEAT_RATE,
+            chamber_volume,
         )
+        volume_heat_release_rate = required_power / chamber_volume
 
-        # Calculate thermal efficiency
-        thermal_efficiency = (1 - heat_loss_rate / required_power) * 100
+        # Calculate chamber dimensions
+        chamber_diameter, chamber_length, chamber_area = (
+            self._calculate_chamber_dimensions(chamber_volume)
+        )
 
-        if thermal_efficiency < target_efficiency * 100:
-            # Increase insulation thickness recommendation
-            pass  # This could trigger a warning or recommendation
+        # Calculate heat transfer and wall temperature
+        heat_transfer_coefficient = _heat_transfer_coefficient(
+            flame_temperature, chamber_diameter, flue_gas_flow_rate
+        )
 
-        return ChamberDesignResults(
-            chamber_volume=chamber_volume,
-            chamber_diameter=chamber_diameter,
-            chamber_length=chamber_length,
-            chamber_area=chamber_area,
-            chamber_surface_area=chamber_surface_area,
-            residence_time=actual_residence_time,
-            heat_transfer_coefficient=heat_transfer_coefficient,
-            wall_temperature=wall_temperature,
-            heat_loss_rate=heat_loss_rate,
-            thermal_efficiency=thermal_efficiency,
-            volume_heat_release_rate=volume_heat_release_rate,
+        # Calculate wall temperature and heat losses
+        wall_temperature, wall_heat_flux = _wall_temperature_and_heat_flux(
+            flame_temperature,
+            heat_transfer_coefficient,
+            wall_insulation_thickness,
+            ambient_temperature,
+        )
+
+        chamber_surface_area = self._calculate_chamber_surface_area(
+            chamber_diameter, chamber_length
         )
+        heat_loss_rate = wall_heat_flux * chamber_surface_area
+
+        return {
+            "chamber_volume": chamber_volume,
+            "chamber_diameter": chamber_diameter,
+            "chamber_length": chamber_length,
+            "chamber_area": chamber_area,
+            "chamber_surface_area": chamber_surface_area,
+            "residence_time": chamber_volume / flue_gas_volume_flow,
+            "heat_transfer_coefficient": heat_transfer_coefficient,
+            "wall_temperature": wall_temperature,
+            "heat_loss_rate": heat_loss_rate,
+            "thermal_efficiency": (1 - heat_loss_rate / required_power) * 100,
+            "volume_heat_release_rate": volume_heat_release_rate,
+        }
 
     def _calculate_flue_gas_volume_flow(
         self, combustion_results: CombustionResults, gas_temperature: float
@@ -242,39 +490,34 @@ class ChamberDesigner:
         Returns:
             float: Volumetric flow rate [m³/s]
         """
-        constants = self.combustion_calc.constants
-
-        # Using ideal gas law to convert mass flow to volume flow
-        # V̇ = (ṁ * R * T) / (P * M)
-        gas_constant = constants["universal_gas_constant"]
-        pressure = constants["standard_pressure"]  # Assume atmospheric pressure
-        molecular_weight = constants["air_molecular_weight"] / 1000  # kg/mol
-
-        volume_flow = (
-            combustion_results.flue_gas_flow_rate * gas_constant * gas_temperature
-        ) / (pressure * molecular_weight)
-
-        return volume_flow
+        return _flue_gas_volume_flow(
+            combustion_results.flue_gas_flow_rate,
+            gas_temperature,
+            self.combustion_calc.constants,
+        )
 
     def _calculate_chamber_dimensions(
-        self, volume: float
-    ) -> Tuple[float, float, float]:
+        self, volume: Union[float, np.ndarray]
+    ) -> Tuple[Union[float, np.ndarray], ...]:
         """
         Calculate chamber dimensions based on required volume.
 
+        Accepts a scalar volume or a NumPy array of volumes.
+
         Args:
-            volume (float): Required chamber volume [m³]
+            volume (float or np.ndarray): Required chamber volume [m³]
 
         Returns:
-            Tuple[float, float, float]: Diameter, length, and cross-sectional area
+            Tuple: Diameter [m], length [m] and cross-sectional area [m²], each
+                float or np.ndarray
         """
         # Calculate diameter based on cylindrical chamber with L/D ratio
         # V = π * D² * L / 4, with L = L/D * D
         diameter = (4 * volume / (math.pi * self.TYPICAL_LD_RATIO)) ** (1 / 3)
 
         # Apply practical limits
-        diameter = max(
-            self.MIN_CHAMBER_DIAMETER, min(self.MAX_CHAMBER_DIAMETER, diameter)
+        diameter = np.minimum(
+            np.maximum(diameter, self.MIN_CHAMBER_DIAMETER), self.MAX_CHAMBER_DIAMETER
         )
 
         # Calculate length and area
@@ -297,32 +540,13 @@ class ChamberDesigner:
         Returns:
             float: Heat transfer coefficient [W/m²K]
         """
-        # Simplified calculation based on empirical correlations
-        # For turbulent flow in cylindrical chambers
-
-        # Calculate Reynolds number (simplified)
-        gas_velocity = mass_flow_rate / (
-            1.0 * math.pi * chamber_diameter**2 / 4  # Assuming ρ ≈ 1 kg/m³ at high temp
+        # The kernel is array-safe; keep scalar designs as plain Python floats
+        return float(
+            _heat_transfer_coefficient(
+                gas_temperature, chamber_diameter, mass_flow_rate
+            )
         )
 
-        reynolds = (
-            1.0 * gas_velocity * chamber_diameter / 2e-5
-        )  # ν ≈ 2e-5 m²/s for hot gases
-
-        # Nusselt number correlation for turbulent flow
-        if reynolds > 2300:
-            nusselt = 0.023 * (reynolds**0.8) * (0.7**0.4)  # Pr ≈ 0.7 for gases
-        else:
-            nusselt = 3.66  # Laminar flow
-
-        # Thermal conductivity of hot combustion gases
-        thermal_conductivity = 0.05 + (gas_temperature - 273.15) * 5e-5  # Empirical
-
-        # Heat transfer coefficient
-        h = nusselt * thermal_conductivity / chamber_diameter
-
-        return h
-
     def _calculate_wall_temperature(
         self,
         gas_temperature: float,
@@ -342,24 +566,12 @@ class ChamberDesigner:
         Returns:
             float: Wall temperature [K]
         """
-        # Thermal conductivity of insulation (typical refractory material)
-        insulation_conductivity = 0.2  # W/mK
-
-        # External heat transfer coefficient (natural convection + radiation)
-        h_external = 10.0  # W/m²K
-
-        # Thermal resistances
-        r_convection = 1 / heat_transfer_coefficient
-        r_conduction = insulation_thickness / insulation_conductivity
-        r_external = 1 / h_external
-
-        total_resistance = r_convection + r_conduction + r_external
-
-        # Heat flux (assuming steady state)
-        heat_flux = (gas_temperature - ambient_temperature) / total_resistance
-
-        # Wall temperature (inner surface)
-        wall_temperature = gas_temperature - heat_flux * r_convection
+        wall_temperature, _ = _wall_temperature_and_heat_flux(
+            gas_temperature,
+            heat_transfer_coefficient,
+            insulation_thickness,
+            ambient_temperature,
+        )
 
         return wall_temperature
 
@@ -399,22 +611,10 @@ class ChamberDesigner:
         Returns:
             float: Heat loss rate [W]
         """
-        # Thermal conductivity of insulation
-        insulation_conductivity = 0.2  # W/mK
-
-        # External heat transfer coefficient
-        h_external = 10.0  # W/m²K
-
-        # Overall heat transfer coefficient through insulation
-        u_overall = 1 / (
-            insulation_thickness / insulation_conductivity + 1 / h_external
+        return _wall_heat_loss(
+            surface_area, wall_temperature, ambient_temperature, insulation_thickness
         )
 
-        # Heat loss calculation
-        heat_loss = u_overall * surface_area * (wall_temperature - ambient_temperature)
-
-        return heat_loss
-
     def calculate_temperature_distribution(
         self,
         design_results: ChamberDesignResults,
@@ -432,25 +632,21 @@ class ChamberDesigner:
         Returns:
             Dict[str, list]: Dictionary with position and temperature arrays
         """
-        positions = []
-        temperatures = []
+        positions = np.linspace(0.0, design_results.chamber_length, num_points + 1)
 
         inlet_temperature = combustion_results.adiabatic_flame_temperature
-
-        for i in range(num_points + 1):
-            position = i * design_results.chamber_length / num_points
-            positions.append(position)
-
-            # Exponential temperature decay along length (simplified model)
-            decay_constant = 2.0 / design_results.chamber_length
-            temperature = inlet_temperature * math.exp(
-                -decay_constant * position
-            ) + design_results.wall_temperature * (
-                1 - math.exp(-decay_constant * position)
-            )
-            temperatures.append(temperature)
-
-        return {"positions": positions, "temperatures": temperatures}
+        wall_temperature = design_results.wall_temperature
+
+        # Exponential temperature decay along length (simplified model):
+        # T(x) = T_wall + (T_inlet - T_wall) * exp(-k * x), built in one buffer
+        decay_constant = 2.0 / design_results.chamber_length
+        temperatures = np.multiply(positions, -decay_constant)
+        np.exp(temperatures, out=temperatures)
+        temperatures *= inlet_temperature - wall_temperature
+        temperatures += wall_temperature
+
+        # Profiles are returned as plain lists, e.g. for JSON export
+        return {"positions": positions.tolist(), "temperatures": temperatures.tolist()}
 
     def validate_design(self, design_results: ChamberDesignResults) -> Dict[str, bool]:
         """
@@ -7,17 +7,23 @@ Combustion calculations module for gas burner design application.
 Handles stoichiometric calculations, flame temperature, and combustion products.
 """
 
+import copy
 import json
 import os
 from dataclasses import dataclass
-from typing import Tuple
+from functools import lru_cache
+from typing import Dict, Tuple, Union
 
+import numpy as np
 
-@dataclass
+
+@dataclass(frozen=True)
 class CombustionResults:
     """
     Data class containing results of combustion calculations.
 
+    Instances are immutable; use dataclasses.replace() to derive a variant.
+
     Attributes:
         fuel_flow_rate (float): Fuel mass flow rate [kg/s]
         air_flow_rate (float): Air mass flow rate [kg/s]
@@ -39,6 +45,26 @@ class CombustionResults:
     o2_volume_percent: float
 
 
+@lru_cache(maxsize=8)
+def _read_fuel_data(file_path: str, mtime_ns: int) -> dict:
+    """
+    Read and parse a fuel data JSON file, caching the result per path.
+
+    The modification time is part of the cache key, so an edited file is
+    parsed again. The returned dictionary is the cached object itself; callers
+    get a deep copy through CombustionCalculator._load_fuel_data.
+
+    Args:
+        file_path (str): Absolute path to the JSON file
+        mtime_ns (int): File modification time [ns]
+
+    Returns:
+        dict: Parsed fuel data
+    """
+    with open(file_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
 class CombustionCalculator:
     """
     Calculator for combustion processes in gas burners.
@@ -82,8 +108,10 @@ class CombustionCalculator:
             json.JSONDecodeError: If the file contains invalid JSON
         """
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            file_path = os.path.abspath(file_path)
+            fuel_data = _read_fuel_data(file_path, os.stat(file_path).st_mtime_ns)
+            # Own copy per calculator, so edits never reach the cached data
+            return copy.deepcopy(fuel_data)
         except FileNotFoundError:
             raise FileNotFoundError(f"Soubor s daty paliv nebyl nalezen: {file_path}")
         except json.JSONDecodeError:
@@ -113,6 +141,34 @@ class CombustionCalculator:
 
         return fuel_flow_rate * air_fuel_ratio
 
+    def calculate_stoichiometric_air_batch(
+        self, fuel_type: str, fuel_flow_rates: np.ndarray
+    ) -> np.ndarray:
+        """
+        Calculate stoichiometric air requirement for many fuel flow rates at once.
+
+        The air/fuel ratio is looked up once and applied to the whole array,
+        which avoids calling the scalar method in a loop during parameter sweeps.
+
+        Args:
+            fuel_type (str): Type of fuel ('natural_gas', 'methane', 'propane')
+            fuel_flow_rates (np.ndarray): Fuel mass flow rates [kg/s]
+
+        Returns:
+            np.ndarray: Required air mass flow rates [kg/s]
+
+        Raises:
+            ValueError: If fuel type is not supported
+        """
+        if fuel_type not in self.fuel_data["fuels"]:
+            raise ValueError(f"Nepodporovaný typ paliva: {fuel_type}")
+
+        fuel_props = self.fuel_data["fuels"][fuel_type]["properties"]
+
+        air_fuel_ratio = fuel_props["air_fuel_ratio_mass"]
+
+        return np.asarray(fuel_flow_rates, dtype=float) * air_fuel_ratio
+
     def calculate_combustion_products(
         self, fuel_type: str, fuel_flow_rate: float, excess_air_ratio: float = 1.2
     ) -> CombustionResults:
@@ -174,18 +230,88 @@ class CombustionCalculator:
             o2_volume_percent=o2_percent,
         )
 
+    def calculate_combustion_products_batch(
+        self,
+        fuel_type: str,
+        fuel_flow_rates: Union[float, np.ndarray],
+        excess_air_ratios: Union[float, np.ndarray] = 1.2,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Calculate combustion products for arrays of operating points at once.
+
+        Fuel flow rates and excess air ratios are broadcast against each other,
+        so either may be a scalar, e.g. for an excess air sweep at fixed flow.
+
+        Args:
+            fuel_type (str): Type of fuel
+            fuel_flow_rates (float or np.ndarray): Fuel mass flow rates [kg/s]
+            excess_air_ratios (float or np.ndarray): Excess air ratios [-]
+
+        Returns:
+            Dict[str, np.ndarray]: One array per CombustionResults field
+
+        Raises:
+            ValueError: If fuel type is not supported or inputs are invalid
+        """
+        if fuel_type not in self.fuel_data["fuels"]:
+            raise ValueError(f"Nepodporovaný typ paliva: {fuel_type}")
+
+        fuel_flow_rates, excess_air_ratios = np.broadcast_arrays(
+            np.asarray(fuel_flow_rates, dtype=float),
+            np.asarray(excess_air_ratios, dtype=float),
+        )
+
+        if np.any(fuel_flow_rates <= 0):
+            raise ValueError("Průtok paliva musí být větší než nula")
+
+        if np.any(excess_air_ratios < 1.0):
+            raise ValueError("Koeficient přebytku vzduchu musí být ≥ 1.0")
+
+        fuel_props = self.fuel_data["fuels"][fuel_type]["properties"]
+
+        # Calculate air and flue gas flow rates
+        actual_air_flows = (
+            self.calculate_stoichiometric_air_batch(fuel_type, fuel_flow_rates)
+            * excess_air_ratios
+        )
+        flue_gas_flows = fuel_flow_rates + actual_air_flows
+
+        # Calculate heat release rates
+        heat_release_rates = fuel_flow_rates * fuel_props["lower_heating_value_mass"]
+
+        # Flame temperature and flue gas composition depend only on excess air
+        adiabatic_temps = self._calculate_adiabatic_temperature(
+            fuel_type, excess_air_ratios
+        )
+        co2_percents, o2_percents = self._calculate_flue_gas_composition(
+            fuel_type, excess_air_ratios
+        )
+
+        return {
+            "fuel_flow_rate": fuel_flow_rates,
+            "air_flow_rate": actual_air_flows,
+            "flue_gas_flow_rate": flue_gas_flows,
+            "adiabatic_flame_temperature": adiabatic_temps,
+            "heat_release_rate": heat_release_rates,
+            "excess_air_ratio": excess_air_ratios,
+            "co2_volume_percent": co2_percents,
+            "o2_volume_percent": o2_percents,
+        }
+
     def _calculate_adiabatic_temperature(
-        self, fuel_type: str, excess_air_ratio: float
-    ) -> float:
+        self, fuel_type: str, excess_air_ratio: Union[float, np.ndarray]
+    ) -> Union[float, np.ndarray]:
         """
         Calculate adiabatic flame temperature.
 
+        Accepts a scalar excess air ratio or a NumPy array of them.
+
         Args:
             fuel_type (str): Type of fuel
-            excess_air_ratio (float): Excess air ratio
+            excess_air_ratio (float or np.ndarray): Excess air ratio
 
         Returns:
-            float: Adiabatic flame temperature [K]
+            float or np.ndarray: Adiabatic flame temperature [K]
         """
         # Simplified calculation based on heating value and heat capacity
         # More accurate calculation would require detailed thermodynamic properties
@@ -200,17 +326,19 @@ class CombustionCalculator:
         )
 
     def _calculate_flue_gas_composition(
-        self, fuel_type: str, excess_air_ratio: float
-    ) -> Tuple[float, float]:
+        self, fuel_type: str, excess_air_ratio: Union[float, np.ndarray]
+    ) -> Tuple[Union[float, np.ndarray], Union[float, np.ndarray]]:
         """
         Calculate CO2 and O2 volume percentages in flue gas.
 
+        Accepts a scalar excess air ratio or a NumPy array of them.
+
         Args:
             fuel_type (str): Type of fuel
-            excess_air_ratio (float): Excess air ratio
+            excess_air_ratio (float or np.ndarray): Excess air ratio
 
         Returns:
-            Tuple[float, float]: CO2 and O2 volume percentages
+            Tuple: CO2 and O2 volume percentages, each float or np.ndarray
         """
         # Simplified calculation based on empirical data
         # More accurate calculation would require detailed stoichiometric analysis
@@ -9,7 +9,9 @@ Handles friction losses in pipes, minor losses from fittings, and system pressur
 
 import math
 from dataclasses import dataclass
-from typing import Dict, List, Tuple
+from typing import Dict, List, Sequence, Tuple, Union
+
+import numpy as np
 
 try:
     from .combustion import CombustionCalculator
@@ -18,8 +20,124 @@ except ImportError:
     from combustion import CombustionCalculator
     from burner_design import BurnerDesignResults
 
+GRAVITATIONAL_ACCELERATION = 9.81  # m/s²
+
+
+def _swamee_jain_friction_factor(reynolds: float, relative_roughness: float) -> float:
+    """
+    Explicit Swamee-Jain approximation of the Colebrook-White friction factor.
+
+    Within about 1 % of Colebrook-White for 5e3 < Re < 1e8, 1e-6 < ε/D < 1e-2.
+
+    Args:
+        reynolds (float): Reynolds number [-]
+        relative_roughness (float): Relative roughness (ε/D) [-]
+
+    Returns:
+        float: Darcy friction factor [-]
+    """
+    return 0.25 / math.log10(relative_roughness / 3.7 + 5.74 / reynolds**0.9) ** 2
+
+
+def _colebrook_white_friction_factor(
+    reynolds: float, relative_roughness: float
+) -> float:
+    """
+    Solve Colebrook-White equation iteratively for friction factor.
+
+    Args:
+        reynolds (float): Reynolds number [-]
+        relative_roughness (float): Relative roughness (ε/D) [-]
+
+    Returns:
+        float: Friction factor [-]
+    """
+    # Initial guess from the explicit Swamee-Jain approximation, which is
+    # closer to the root than Blasius and saves fixed-point iterations
+    f = _swamee_jain_friction_factor(reynolds, relative_roughness)
+
+    # Iterative solution
+    for _ in range(10):  # Maximum 10 iterations
+        f_new = (
+            -2 * math.log10(relative_roughness / 3.7 + 2.51 / (reynolds * math.sqrt(f)))
+        ) ** (-2)
+
+        if abs(f_new - f) < 1e-6:
+            break
+        f = f_new
+
+    return f
+
+
+def _colebrook_white_array(
+    reynolds: np.ndarray, relative_roughness: Union[float, np.ndarray]
+) -> np.ndarray:
+    """
+    Solve Colebrook-White element-wise with the same iteration as the scalar solver.
+
+    Each element stops updating once its own step falls below the tolerance, so
+    results match _colebrook_white_friction_factor value for value.
+
+    Args:
+        reynolds (np.ndarray): Reynolds numbers [-]
+        relative_roughness (float or np.ndarray): Relative roughness (ε/D),
+            broadcastable against reynolds [-]
+
+    Returns:
+        np.ndarray: Friction factors [-]
+    """
+    # Swamee-Jain starting value, as in the scalar solver
+    f = 0.25 / np.log10(relative_roughness / 3.7 + 5.74 / reynolds**0.9) ** 2
+    active = np.ones(f.shape, dtype=bool)
+
+    for _ in range(10):  # Maximum 10 iterations
+        f_new = (
+            -2 * np.log10(relative_roughness / 3.7 + 2.51 / (reynolds * np.sqrt(f)))
+        ) ** (-2)
+
+        active &= np.abs(f_new - f) >= 1e-6
+        if not active.any():
+            break
+        f = np.where(active, f_new, f)
+
+    return f
 
-@dataclass
+
+def _friction_factor_array(
+    reynolds: np.ndarray, relative_roughness: Union[float, np.ndarray]
+) -> np.ndarray:
+    """
+    Darcy friction factor over an array of Reynolds numbers.
+
+    Uses the same laminar, transition and Colebrook-White regimes as
+    PressureLossCalculator._calculate_friction_factor.
+
+    Args:
+        reynolds (np.ndarray): Reynolds numbers [-]
+        relative_roughness (float or np.ndarray): Relative roughness (ε/D),
+            broadcastable against reynolds [-]
+
+    Returns:
+        np.ndarray: Darcy friction factors [-]
+    """
+    reynolds = np.asarray(reynolds, dtype=float)
+
+    f_laminar = 64 / reynolds
+    f_4000 = _colebrook_white_array(np.array(4000.0), relative_roughness)
+    f_transition = 64 / 2300 + (f_4000 - 64 / 2300) * (reynolds - 2300) / (4000 - 2300)
+    # Evaluate Colebrook-White only where it applies; other entries are discarded
+    f_turbulent = _colebrook_white_array(
+        np.maximum(reynolds, 4000.0), relative_roughness
+    )
+
+    return np.where(
+        reynolds < 2300,
+        f_laminar,
+        np.where(reynolds < 4000, f_transition, f_turbulent),
+    )
+
+
+@dataclass(frozen=True)
 class PipeSegment:
     """
     Data class representing a pipe segment with its properties.
@@ -38,8 +156,24 @@ class PipeSegment:
     material: str
     elevation_change: float = 0.0
 
+    @classmethod
+    def to_arrays(cls, segments: Sequence["PipeSegment"]) -> Dict[str, np.ndarray]:
+        """
+        Convert a sequence of pipe segments into column arrays.
 
-@dataclass
+        Args:
+            segments (Sequence[PipeSegment]): Pipe segments of a system
+
+        Returns:
+            Dict[str, np.ndarray]: One array per segment field
+        """
+        return {
+            name: np.array([getattr(segment, name) for segment in segments])
+            for name in cls.__dataclass_fields__
+        }
+
+
+@dataclass(frozen=True)
 class Fitting:
     """
     Data class representing a pipe fitting.
@@ -57,7 +191,7 @@ class Fitting:
     diameter: float
 
 
-@dataclass
+@dataclass(frozen=True)
 class PressureLossResults:
     """
     Data class containing results of pressure loss calculations.
@@ -250,6 +384,111 @@ class PressureLossCalculator:
             velocity_pressure=main_velocity_pressure,
         )
 
+    def calculate_system_pressure_losses_batch(
+        self,
+        pipe_segments: List[PipeSegment],
+        fittings: List[Fitting],
+        mass_flow_rates: Sequence[float],
+        gas_density: float,
+        gas_viscosity: float = 1.5e-5,
+        burner_results: BurnerDesignResults = None,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Calculate system pressure losses for a sweep of mass flow rates in one pass.
+
+        Applies the same method as calculate_system_pressure_losses, with the
+        friction, fitting and velocity-pressure terms evaluated as NumPy array
+        operations over the flow rates.
+
+        Args:
+            pipe_segments (List[PipeSegment]): List of pipe segments
+            fittings (List[Fitting]): List of fittings and components
+            mass_flow_rates (Sequence[float]): Gas mass flow rates [kg/s]
+            gas_density (float): Gas density [kg/m³]
+            gas_viscosity (float): Dynamic viscosity [Pa·s]
+            burner_results (BurnerDesignResults, optional): Burner design results
+
+        Returns:
+            Dict[str, np.ndarray]: One array per PressureLossResults field,
+                ordered like mass_flow_rates
+
+        Raises:
+            ValueError: If input parameters are invalid
+        """
+        flow_rates = np.asarray(mass_flow_rates, dtype=float)
+
+        if np.any(flow_rates <= 0):
+            raise ValueError("Hmotnostní průtok musí být větší než nula")
+
+        if gas_density <= 0:
+            raise ValueError("Hustota plynu musí být větší než nula")
+
+        if not pipe_segments:
+            raise ValueError("Musí být zadán alespoň jeden úsek potrubí")
+
+        # Friction losses for every segment (rows) and flow rate (columns) at once
+        segments = PipeSegment.to_arrays(pipe_segments)
+        diameters = segments["diameter"][:, np.newaxis]
+
+        area = np.pi * diameters**2 / 4
+        velocity = flow_rates / (gas_density * area)
+        reynolds = gas_density * velocity * diameters / gas_viscosity
+        friction_factor = _friction_factor_array(
+            reynolds, segments["roughness"][:, np.newaxis] / diameters
+        )
+        velocity_pressure = 0.5 * gas_density * velocity**2
+
+        total_friction_loss = np.sum(
+            friction_factor
+            * (segments["length"][:, np.newaxis] / diameters)
+            * velocity_pressure,
+            axis=0,
+        )
+
+        # Values from the largest diameter pipe (assumed to be main pipe); the
+        # last one wins on ties, as in calculate_system_pressure_losses
+        main = np.flatnonzero(segments["diameter"] == segments["diameter"].max())[-1]
+        main_reynolds = reynolds[main]
+        main_friction_factor = friction_factor[main]
+        main_velocity_pressure = velocity_pressure[main]
+
+        # Minor losses from fittings (the K-factor kernel is array-safe)
+        total_minor_loss = np.zeros_like(flow_rates)
+        for fitting in fittings:
+            total_minor_loss += self._calculate_fitting_loss(
+                fitting, flow_rates, gas_density
+            )
+
+        # Elevation and burner losses do not depend on flow rate
+        total_elevation_loss = np.full_like(
+            flow_rates, self._calculate_elevation_losses(pipe_segments, gas_density)
+        )
+        burner_pressure_loss = np.full_like(
+            flow_rates, burner_results.burner_pressure_drop if burner_results else 0.0
+        )
+
+        total_pressure_loss = (
+            total_friction_loss
+            + total_minor_loss
+            + total_elevation_loss
+            + burner_pressure_loss
+        )
+
+        return {
+            "total_pressure_loss": total_pressure_loss,
+            "friction_losses": total_friction_loss,
+            "minor_losses": total_minor_loss,
+            "elevation_losses": total_elevation_loss,
+            "burner_pressure_loss": burner_pressure_loss,
+            "required_supply_pressure": total_pressure_loss * self.safety_factor,
+            # Velocity pressure is positive for validated flow rates and density
+            "system_resistance_coefficient": total_pressure_loss
+            / main_velocity_pressure,
+            "reynolds_number": main_reynolds,
+            "friction_factor": main_friction_factor,
+            "velocity_pressure": main_velocity_pressure,
+        }
+
     def _calculate_pipe_friction_loss(
         self,
         segment: PipeSegment,
@@ -333,37 +572,26 @@ class PressureLossCalculator:
         Returns:
             float: Friction factor [-]
         """
-        # Initial guess using Blasius equation
-        f = 0.316 * reynolds ** (-0.25)
-
-        # Iterative solution
-        for _ in range(10):  # Maximum 10 iterations
-            f_new = (
-                -2
-                * math.log10(
-                    relative_roughness / 3.7 + 2.51 / (reynolds * math.sqrt(f))
-                )
-            ) ** (-2)
-
-            if abs(f_new - f) < 1e-6:
-                break
-            f = f_new
-
-        return f
+        return _colebrook_white_friction_factor(reynolds, relative_roughness)
 
     def _calculate_fitting_loss(
-        self, fitting: Fitting, mass_flow_rate: float, gas_density: float
-    ) -> float:
+        self,
+        fitting: Fitting,
+        mass_flow_rate: Union[float, np.ndarray],
+        gas_density: float,
+    ) -> Union[float, np.ndarray]:
         """
         Calculate pressure loss through a fitting.
 
+        Accepts a scalar mass flow rate or a NumPy array of them.
+
         Args:
             fitting (Fitting): Fitting properties
-            mass_flow_rate (float): Mass flow rate [kg/s]
+            mass_flow_rate (float or np.ndarray): Mass flow rate [kg/s]
             gas_density (float): Gas density [kg/m³]
 
         Returns:
-            float: Pressure loss [Pa]
+            float or np.ndarray: Pressure loss [Pa]
         """
         # Calculate velocity in fitting
         area = math.pi * fitting.diameter**2 / 4
@@ -395,9 +623,8 @@ class PressureLossCalculator:
         )
 
         # Hydrostatic pressure change: ΔP = ρ * g * Δh
-        gravitational_acceleration = 9.81  # m/s²
         elevation_loss = (
-            gas_density * gravitational_acceleration * total_elevation_change
+            gas_density * GRAVITATIONAL_ACCELERATION * total_elevation_change
         )
 
         return elevation_loss
@@ -491,7 +718,6 @@ class PressureLossCalculator:
         # Iterate through diameters to find optimal size
         diameters = [d / 1000 for d in range(25, 500, 5)]  # 25mm to 500mm in 5mm steps
 
-        best_diameter = None
         best_results = None
 
         for diameter in diameters:
@@ -514,17 +740,16 @@ class PressureLossCalculator:
                 )
             )
 
-            # Check if pressure loss is acceptable
+            # Diameters ascend, so the first acceptable one is the smallest
             if pressure_loss <= max_pressure_loss:
-                if best_diameter is None or diameter < best_diameter:
-                    best_diameter = diameter
-                    best_results = {
-                        "diameter": diameter,
-                        "velocity": velocity,
-                        "pressure_loss": pressure_loss,
-                        "reynolds_number": reynolds,
-                        "friction_factor": friction_factor,
-                    }
+                best_results = {
+                    "diameter": diameter,
+                    "velocity": velocity,
+                    "pressure_loss": pressure_loss,
+                    "reynolds_number": reynolds,
+                    "friction_factor": friction_factor,
+                }
+                break
 
         if best_results is None:
             # No suitable diameter found
@@ -4,5 +4,14 @@
 tests/__init__.py
 
 Test package initialization for the Gas Burner Calculator application.
-This module provides common test utilities and configuration.
+Makes the calculation modules in src/ importable exactly once, for both
+pytest and plain unittest runs.
 """
+
+import os
+import sys
+
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
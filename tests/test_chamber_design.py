@@ -9,45 +9,85 @@ Tests chamber dimensioning, heat transfer calculations, and validation logic.
 
 import math
 import os
-import sys
 import unittest
-from unittest.mock import Mock
+from dataclasses import fields, replace
+from types import SimpleNamespace
 
-# Add src directory to path for imports  # noqa: E402
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
-from chamber_design import ChamberDesigner, ChamberDesignResults  # noqa: E402
-from combustion import CombustionCalculator, CombustionResults  # noqa: E402
-from burner_design import BurnerDesigner  # noqa: E402
+import numpy as np
+
+from burner_design import BurnerDesigner
+from chamber_design import (
+    ChamberDesigner,
+    ChamberDesignResults,
+    _heat_transfer_coefficient,
+    _wall_temperature_and_heat_flux,
+)
+from combustion import CombustionCalculator, CombustionResults
+
+
+class _StubCombustion:
+    """Lightweight stand-in for CombustionCalculator in chamber tests."""
+
+    def __init__(self, fuel_props, constants, result):
+        self.fuel_props = fuel_props
+        self.constants = constants
+        self.result = result
+
+    def get_fuel_properties(self, fuel_type):
+        return self.fuel_props
+
+    def calculate_combustion_products(self, *args, **kwargs):
+        return self.result
 
 
 class TestChamberDesigner(unittest.TestCase):
     """Test cases for ChamberDesigner class."""
 
-    def setUp(self):
-        """Set up test fixtures."""
+    # Mock fuel properties (read-only, shared by all tests)
+    _MOCK_FUEL_PROPS = {
+        "properties": {
+            "lower_heating_value_mass": 50000000,  # J/kg
+            "molecular_weight": 16.04,  # g/mol
+            "density": 0.717,  # kg/m³
+        }
+    }
+
+    # Mock constants (read-only, shared by all tests)
+    _MOCK_CONSTANTS = {
+        "universal_gas_constant": 8.314,  # J/(mol·K)
+        "standard_pressure": 101325,  # Pa
+        "air_molecular_weight": 28.97,  # g/mol
+    }
+
+    # Reference design results (frozen, so safe to share); tests derive
+    # variants with dataclasses.replace
+    _GOLDEN_RESULTS = ChamberDesignResults(
+        chamber_volume=1.0,
+        chamber_diameter=1.0,
+        chamber_length=3.0,
+        chamber_area=0.785,
+        chamber_surface_area=12.57,
+        residence_time=0.5,
+        heat_transfer_coefficient=50.0,
+        wall_temperature=800.0,
+        heat_loss_rate=5000.0,
+        thermal_efficiency=80.0,
+        volume_heat_release_rate=1e6,
+    )
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up the designer shared by all tests in the class."""
         # Use correct path to data directory
         data_path = os.path.join(os.path.dirname(__file__), "..", "data", "fuels.json")
-        self.designer = ChamberDesigner(fuel_data_path=data_path)
-
-        # Create mock objects
-        self.mock_combustion = Mock(spec=CombustionCalculator)
-        self.mock_burner = Mock(spec=BurnerDesigner)
-
-        # Mock fuel properties
-        self.mock_fuel_props = {
-            "properties": {
-                "lower_heating_value_mass": 50000000,  # J/kg
-                "molecular_weight": 16.04,  # g/mol
-                "density": 0.717,  # kg/m³
-            }
-        }
+        cls._default_designer = ChamberDesigner(fuel_data_path=data_path)
 
-        # Mock constants
-        self.mock_constants = {
-            "universal_gas_constant": 8.314,  # J/(mol·K)
-            "standard_pressure": 101325,  # Pa
-            "air_molecular_weight": 28.97,  # g/mol
-        }
+    def setUp(self):
+        """Set up test fixtures."""
+        self.designer = self._default_designer
+
+        # Only identity matters for the injected burner designer
+        self.mock_burner = SimpleNamespace()
 
         # Mock combustion results
         self.mock_combustion_result = CombustionResults(
@@ -61,17 +101,27 @@ class TestChamberDesigner(unittest.TestCase):
             o2_volume_percent=2.0,
         )
 
-        # Setup mock returns
-        self.mock_combustion.get_fuel_properties.return_value = self.mock_fuel_props
-        self.mock_combustion.constants = self.mock_constants
-        self.mock_combustion.calculate_combustion_products.return_value = (
-            self.mock_combustion_result
+        # Plain stub avoids the attribute introspection done by Mock(spec=...)
+        self.mock_combustion = _StubCombustion(
+            self._MOCK_FUEL_PROPS, self._MOCK_CONSTANTS, self.mock_combustion_result
         )
+        self.mocked_designer = ChamberDesigner(
+            combustion_calculator=self.mock_combustion
+        )
+
+    def _design(self, **overrides):
+        """Run design_chamber on the mocked designer with baseline inputs."""
+        kwargs = {
+            "fuel_type": "methane",
+            "required_power": 100000,  # 100 kW
+            "target_residence_time": 0.5,
+            **overrides,
+        }
+        return self.mocked_designer.design_chamber(**kwargs)
 
     def test_initialization_default(self):
         """Test default initialization."""
-        data_path = os.path.join(os.path.dirname(__file__), "..", "data", "fuels.json")
-        designer = ChamberDesigner(fuel_data_path=data_path)
+        designer = self._default_designer
         self.assertIsInstance(designer.combustion_calc, CombustionCalculator)
         self.assertIsInstance(designer.burner_designer, BurnerDesigner)
         self.assertEqual(designer.safety_factor, 1.5)
@@ -89,7 +139,7 @@ class TestChamberDesigner(unittest.TestCase):
 
     def test_design_chamber_basic(self):
         """Test basic chamber design calculation."""
-        designer = ChamberDesigner(combustion_calculator=self.mock_combustion)
+        designer = self.mocked_designer
 
         result = designer.design_chamber(
             fuel_type="methane",
@@ -115,49 +165,67 @@ class TestChamberDesigner(unittest.TestCase):
 
     def test_design_chamber_different_parameters(self):
         """Test chamber design with different parameter values."""
-        designer = ChamberDesigner(combustion_calculator=self.mock_combustion)
-
-        # Test different residence times
         residence_times = [0.2, 0.5, 1.0]
-        results = []
-
-        for rt in residence_times:
-            result = designer.design_chamber(
-                fuel_type="methane", required_power=100000, target_residence_time=rt
-            )
-            results.append(result)
+        results = [self._design(target_residence_time=rt) for rt in residence_times]
 
         # Longer residence time should require larger chamber
-        self.assertLess(results[0].chamber_volume, results[1].chamber_volume)
-        self.assertLess(results[1].chamber_volume, results[2].chamber_volume)
+        for i in range(len(results) - 1):
+            with self.subTest(residence_time=residence_times[i + 1]):
+                self.assertLess(
+                    results[i].chamber_volume, results[i + 1].chamber_volume
+                )
 
     def test_design_chamber_power_scaling(self):
         """Test that chamber dimensions scale properly with power."""
-        designer = ChamberDesigner(combustion_calculator=self.mock_combustion)
-
         powers = [50000, 100000, 200000]  # 50, 100, 200 kW
-        results = []
-
-        for power in powers:
-            # Adjust fuel flow rate in mock for different powers
-            fuel_flow = power / 50000000  # Consistent with mock heating value
-            self.mock_combustion_result.fuel_flow_rate = fuel_flow
-            self.mock_combustion_result.flue_gas_flow_rate = (
-                fuel_flow * 18
-            )  # Approximate
-
-            result = designer.design_chamber(
-                fuel_type="methane", required_power=power, target_residence_time=0.5
+
+        def scaled_products(fuel_type, fuel_flow_rate, excess_air_ratio=1.2):
+            # Derive products from the requested flow instead of mutating the mock
+            return replace(
+                self.mock_combustion_result,
+                fuel_flow_rate=fuel_flow_rate,
+                flue_gas_flow_rate=fuel_flow_rate * 18,  # Approximate
             )
-            results.append(result)
+
+        self.mock_combustion.calculate_combustion_products = scaled_products
+        results = [self._design(required_power=power) for power in powers]
 
         # Higher power should require larger chamber volume
-        self.assertLess(results[0].chamber_volume, results[1].chamber_volume)
-        self.assertLess(results[1].chamber_volume, results[2].chamber_volume)
+        for i in range(len(results) - 1):
+            with self.subTest(power=powers[i + 1]):
+                self.assertLess(
+                    results[i].chamber_volume, results[i + 1].chamber_volume
+                )
+
+    def test_design_chamber_batch(self):
+        """Test that batch design agrees with individual design_chamber calls."""
+        powers = np.linspace(50e3, 500e3, 100)
+        residence_times = np.linspace(0.2, 2.0, 100)
+
+        batch = self.designer.design_chamber_batch(
+            "natural_gas", powers, residence_times
+        )
+        singles = [
+            self.designer.design_chamber(
+                "natural_gas", float(power), target_residence_time=float(time)
+            )
+            for power, time in zip(powers, residence_times)
+        ]
+
+        self.assertEqual(
+            list(batch), [field.name for field in fields(ChamberDesignResults)]
+        )
+        for field, values in batch.items():
+            with self.subTest(field=field):
+                expected = [getattr(result, field) for result in singles]
+                np.testing.assert_allclose(values, expected, rtol=1e-9)
+
+        with self.assertRaisesRegex(ValueError, "příliš krátká"):
+            self.designer.design_chamber_batch("natural_gas", powers, 0.05)
 
     def test_invalid_power(self):
         """Test validation of invalid power values."""
-        designer = ChamberDesigner(combustion_calculator=self.mock_combustion)
+        designer = self.mocked_designer
 
         # Zero power
         with self.assertRaises(ValueError) as context:
@@ -174,7 +242,7 @@ class TestChamberDesigner(unittest.TestCase):
 
     def test_invalid_residence_time(self):
         """Test validation of invalid residence time values."""
-        designer = ChamberDesigner(combustion_calculator=self.mock_combustion)
+        designer = self.mocked_designer
 
         # Too short residence time
         with self.assertRaises(ValueError) as context:
@@ -196,7 +264,7 @@ class TestChamberDesigner(unittest.TestCase):
 
     def test_calculate_flue_gas_volume_flow(self):
         """Test flue gas volume flow calculation."""
-        designer = ChamberDesigner(combustion_calculator=self.mock_combustion)
+        designer = self.mocked_designer
 
         volume_flow = designer._calculate_flue_gas_volume_flow(
             self.mock_combustion_result, 2100.0  # Temperature in K
@@ -213,7 +281,7 @@ class TestChamberDesigner(unittest.TestCase):
 
     def test_calculate_chamber_dimensions(self):
         """Test chamber dimension calculations."""
-        designer = ChamberDesigner()
+        designer = self.designer
 
         volume = 1.0  # m³
         diameter, length, area = designer._calculate_chamber_dimensions(volume)
@@ -223,17 +291,20 @@ class TestChamberDesigner(unittest.TestCase):
         self.assertGreater(length, 0)
         self.assertGreater(area, 0)
 
-        # Check dimensional relationships
-        self.assertAlmostEqual(area, math.pi * diameter**2 / 4, places=6)
-        self.assertAlmostEqual(length, diameter * designer.TYPICAL_LD_RATIO, places=6)
-
-        # Check volume consistency
-        calculated_volume = area * length
-        self.assertAlmostEqual(calculated_volume, volume, places=6)
+        # Check dimensional relationships and volume consistency
+        np.testing.assert_allclose(
+            [area, length, area * length],
+            [
+                math.pi * diameter**2 / 4,
+                diameter * designer.TYPICAL_LD_RATIO,
+                volume,
+            ],
+            rtol=1e-6,
+        )
 
     def test_calculate_chamber_dimensions_limits(self):
         """Test chamber dimension limits."""
-        designer = ChamberDesigner()
+        designer = self.designer
 
         # Very small volume
         diameter_small, _, _ = designer._calculate_chamber_dimensions(0.001)
@@ -245,12 +316,13 @@ class TestChamberDesigner(unittest.TestCase):
 
     def test_calculate_heat_transfer_coefficient(self):
         """Test heat transfer coefficient calculation."""
-        designer = ChamberDesigner()
+        designer = self.designer
 
         h = designer._calculate_heat_transfer_coefficient(
             gas_temperature=2100.0, chamber_diameter=0.5, mass_flow_rate=0.05
         )
 
+        self.assertIs(type(h), float)
         self.assertGreater(h, 0)
         self.assertLess(h, 1000)  # Reasonable range for gas-to-wall heat transfer
 
@@ -261,9 +333,18 @@ class TestChamberDesigner(unittest.TestCase):
         h_high_flow = designer._calculate_heat_transfer_coefficient(2100.0, 0.5, 0.1)
         self.assertGreater(h_high_flow, h)  # Higher flow -> higher h
 
+    def test_heat_transfer_kernel_matches_method(self):
+        """Test that the free heat transfer kernel backs the designer method."""
+        for args in ((2100.0, 0.5, 0.05), (1500.0, 1.2, 0.0001)):
+            with self.subTest(args=args):
+                self.assertEqual(
+                    _heat_transfer_coefficient(*args),
+                    self.designer._calculate_heat_transfer_coefficient(*args),
+                )
+
     def test_calculate_wall_temperature(self):
         """Test wall temperature calculation."""
-        designer = ChamberDesigner()
+        designer = self.designer
 
         wall_temp = designer._calculate_wall_temperature(
             gas_temperature=2100.0,
@@ -286,7 +367,7 @@ class TestChamberDesigner(unittest.TestCase):
 
     def test_calculate_chamber_surface_area(self):
         """Test chamber surface area calculation."""
-        designer = ChamberDesigner()
+        designer = self.designer
 
         diameter = 1.0  # m
         length = 3.0  # m
@@ -302,7 +383,7 @@ class TestChamberDesigner(unittest.TestCase):
 
     def test_calculate_heat_loss(self):
         """Test heat loss calculation."""
-        designer = ChamberDesigner()
+        designer = self.designer
 
         heat_loss = designer._calculate_heat_loss(
             surface_area=10.0,
@@ -319,24 +400,38 @@ class TestChamberDesigner(unittest.TestCase):
         )
         self.assertGreater(heat_loss_high, heat_loss)
 
+    def test_wall_kernel_matches_two_step_calculation(self):
+        """Test that the fused wall kernel agrees with the separate methods."""
+        gas_temperatures = np.array([1500.0, 2100.0])
+        coefficients = np.array([20.0, 50.0])
+        surface_area = 10.0  # m²
+
+        wall_temperatures, heat_fluxes = _wall_temperature_and_heat_flux(
+            gas_temperatures, coefficients, 0.1, 293.15
+        )
+
+        for i, (gas_temperature, coefficient) in enumerate(
+            zip(gas_temperatures, coefficients)
+        ):
+            with self.subTest(gas_temperature=gas_temperature):
+                wall_temperature = self.designer._calculate_wall_temperature(
+                    gas_temperature, coefficient, 0.1, 293.15
+                )
+                heat_loss = self.designer._calculate_heat_loss(
+                    surface_area, wall_temperature, 293.15, 0.1
+                )
+                self.assertAlmostEqual(
+                    wall_temperatures[i], wall_temperature, delta=1e-9
+                )
+                self.assertAlmostEqual(
+                    heat_fluxes[i] * surface_area, heat_loss, delta=1e-6
+                )
+
     def test_calculate_temperature_distribution(self):
         """Test temperature distribution calculation."""
-        designer = ChamberDesigner(combustion_calculator=self.mock_combustion)
-
-        # Create sample design results
-        design_results = ChamberDesignResults(
-            chamber_volume=1.0,
-            chamber_diameter=1.0,
-            chamber_length=3.0,
-            chamber_area=0.785,
-            chamber_surface_area=12.57,
-            residence_time=0.5,
-            heat_transfer_coefficient=50.0,
-            wall_temperature=800.0,
-            heat_loss_rate=5000.0,
-            thermal_efficiency=80.0,
-            volume_heat_release_rate=1e6,
-        )
+        designer = self.mocked_designer
+
+        design_results = self._GOLDEN_RESULTS
 
         temp_dist = designer.calculate_temperature_distribution(
             design_results, self.mock_combustion_result, num_points=5
@@ -345,6 +440,8 @@ class TestChamberDesigner(unittest.TestCase):
         # Check structure
         self.assertIn("positions", temp_dist)
         self.assertIn("temperatures", temp_dist)
+        self.assertIsInstance(temp_dist["positions"], list)
+        self.assertIsInstance(temp_dist["temperatures"], list)
         self.assertEqual(len(temp_dist["positions"]), 6)  # num_points + 1
         self.assertEqual(len(temp_dist["temperatures"]), 6)
 
@@ -359,24 +456,31 @@ class TestChamberDesigner(unittest.TestCase):
         self.assertEqual(positions[0], 0.0)
         self.assertEqual(positions[-1], design_results.chamber_length)
 
+    def test_calculate_temperature_distribution_vectorized(self):
+        """Test a fine temperature profile against the scalar decay model."""
+        designer = self.mocked_designer
+        design_results = self._GOLDEN_RESULTS
+
+        temp_dist = designer.calculate_temperature_distribution(
+            design_results, self.mock_combustion_result, num_points=1000
+        )
+
+        positions = temp_dist["positions"]
+        temperatures = temp_dist["temperatures"]
+        self.assertIsInstance(temperatures[0], float)
+        self.assertEqual(len(positions), 1001)
+
+        # Same model evaluated point by point
+        decay = [math.exp(-2.0 / 3.0 * x) for x in positions]
+        expected = [2100.0 * d + 800.0 * (1 - d) for d in decay]
+        np.testing.assert_allclose(temperatures, expected, rtol=1e-12)
+
     def test_validate_design(self):
         """Test design validation."""
-        designer = ChamberDesigner()
+        designer = self.designer
 
         # Create valid design results
-        valid_results = ChamberDesignResults(
-            chamber_volume=1.0,
-            chamber_diameter=1.0,
-            chamber_length=3.0,
-            chamber_area=0.785,
-            chamber_surface_area=12.57,
-            residence_time=0.5,
-            heat_transfer_coefficient=50.0,
-            wall_temperature=1200.0,  # K
-            heat_loss_rate=5000.0,
-            thermal_efficiency=80.0,
-            volume_heat_release_rate=1e6,
-        )
+        valid_results = replace(self._GOLDEN_RESULTS, wall_temperature=1200.0)
 
         validation = designer.validate_design(valid_results)
 
@@ -399,17 +503,13 @@ class TestChamberDesigner(unittest.TestCase):
 
     def test_validate_design_failures(self):
         """Test validation with invalid design parameters."""
-        designer = ChamberDesigner()
+        designer = self.designer
 
         # Create invalid design results
-        invalid_results = ChamberDesignResults(
-            chamber_volume=1.0,
+        invalid_results = replace(
+            self._GOLDEN_RESULTS,
             chamber_diameter=5.0,  # Too large
-            chamber_length=3.0,
-            chamber_area=0.785,
-            chamber_surface_area=12.57,
             residence_time=0.05,  # Too short
-            heat_transfer_coefficient=50.0,
             wall_temperature=2000.0,  # Too high
             heat_loss_rate=50000.0,  # High losses
             thermal_efficiency=50.0,  # Low efficiency
@@ -427,17 +527,13 @@ class TestChamberDesigner(unittest.TestCase):
 
     def test_get_design_recommendations(self):
         """Test design recommendations generation."""
-        designer = ChamberDesigner()
+        designer = self.designer
 
         # Create design with various issues
-        problematic_results = ChamberDesignResults(
-            chamber_volume=1.0,
-            chamber_diameter=1.0,
+        problematic_results = replace(
+            self._GOLDEN_RESULTS,
             chamber_length=8.0,  # Very long (L/D > 5)
-            chamber_area=0.785,
-            chamber_surface_area=12.57,
             residence_time=0.05,  # Too short
-            heat_transfer_coefficient=50.0,
             wall_temperature=1700.0,  # High temperature
             heat_loss_rate=50000.0,
             thermal_efficiency=60.0,  # Low efficiency
@@ -456,17 +552,6 @@ class TestChamberDesigner(unittest.TestCase):
     def test_high_volume_heat_rate_correction(self):
         """Test automatic correction of high volume heat release rate."""
         # Mock very high power requirement
-        mock_combustion = Mock(spec=CombustionCalculator)
-        mock_fuel_props = {
-            "properties": {
-                "lower_heating_value_mass": 50000000,
-                "molecular_weight": 16.04,
-                "density": 0.717,
-            }
-        }
-        mock_combustion.get_fuel_properties.return_value = mock_fuel_props
-        mock_combustion.constants = self.mock_constants
-
         # High flow rate combustion result
         high_power_result = CombustionResults(
             fuel_flow_rate=0.02,  # High flow rate
@@ -478,7 +563,9 @@ class TestChamberDesigner(unittest.TestCase):
             co2_volume_percent=10.0,
             o2_volume_percent=2.0,
         )
-        mock_combustion.calculate_combustion_products.return_value = high_power_result
+        mock_combustion = _StubCombustion(
+            self._MOCK_FUEL_PROPS, self._MOCK_CONSTANTS, high_power_result
+        )
 
         designer = ChamberDesigner(combustion_calculator=mock_combustion)
 
@@ -496,19 +583,7 @@ class TestChamberDesigner(unittest.TestCase):
 
     def test_chamber_design_results_dataclass(self):
         """Test ChamberDesignResults dataclass functionality."""
-        results = ChamberDesignResults(
-            chamber_volume=1.0,
-            chamber_diameter=1.0,
-            chamber_length=3.0,
-            chamber_area=0.785,
-            chamber_surface_area=12.57,
-            residence_time=0.5,
-            heat_transfer_coefficient=50.0,
-            wall_temperature=800.0,
-            heat_loss_rate=5000.0,
-            thermal_efficiency=80.0,
-            volume_heat_release_rate=1e6,
-        )
+        results = self._GOLDEN_RESULTS
 
         # Test all attributes are accessible
         self.assertEqual(results.chamber_volume, 1.0)
@@ -527,9 +602,13 @@ class TestChamberDesigner(unittest.TestCase):
         self.assertEqual(results.chamber_wall_temperature, 800.0)
         self.assertEqual(results.wall_temperature, results.chamber_wall_temperature)
 
+        # Results are immutable, so the class-level fixture is safe to share
+        with self.assertRaises(AttributeError):
+            results.wall_temperature = 900.0
+
     def test_edge_case_minimal_chamber(self):
         """Test design of minimal chamber."""
-        designer = ChamberDesigner(combustion_calculator=self.mock_combustion)
+        designer = self.mocked_designer
 
         # Very low flow rate for small chamber
         small_result = CombustionResults(
@@ -542,7 +621,7 @@ class TestChamberDesigner(unittest.TestCase):
             co2_volume_percent=10.0,
             o2_volume_percent=2.0,
         )
-        self.mock_combustion.calculate_combustion_products.return_value = small_result
+        self.mock_combustion.result = small_result
 
         result = designer.design_chamber(
             fuel_type="methane",
@@ -556,19 +635,11 @@ class TestChamberDesigner(unittest.TestCase):
 
     def test_different_insulation_thicknesses(self):
         """Test chamber design with different insulation thicknesses."""
-        designer = ChamberDesigner(combustion_calculator=self.mock_combustion)
-
         thicknesses = [0.05, 0.1, 0.2]  # Different insulation thicknesses
-        results = []
-
-        for thickness in thicknesses:
-            result = designer.design_chamber(
-                fuel_type="methane",
-                required_power=100000,
-                target_residence_time=0.5,
-                wall_insulation_thickness=thickness,
-            )
-            results.append(result)
+        results = [
+            self._design(wall_insulation_thickness=thickness)
+            for thickness in thicknesses
+        ]
 
         # Better insulation should result in higher inner wall temperature, lower heat losses, higher efficiency
         self.assertLess(
@@ -583,7 +654,7 @@ class TestChamberDesigner(unittest.TestCase):
 
     def test_constants_validation(self):
         """Test that design constants are reasonable."""
-        designer = ChamberDesigner()
+        designer = self.designer
 
         # Check design constants are reasonable
         self.assertGreater(designer.MIN_RESIDENCE_TIME, 0)
@@ -7,70 +7,80 @@ Unit tests for combustion calculation module.
 Tests stoichiometric calculations, air requirements, and combustion products.
 """
 
+import json
 import os
-import sys
+import tempfile
 import unittest
+from dataclasses import fields
 
-# Add src directory to path for imports  # noqa: E402
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
-from combustion import CombustionCalculator  # noqa: E402
+import numpy as np
+
+from combustion import CombustionCalculator, CombustionResults
 
 
 class TestCombustionCalculator(unittest.TestCase):
     """Test cases for CombustionCalculator class."""
 
-    def setUp(self):
-        """Set up test fixtures."""
+    # (fuel type, fuel flow rate [kg/s], excess air ratio) rejected by the calculator
+    _INVALID_INPUTS = (
+        ("methane", 0.1, 0.8),  # Excess air ratio below stoichiometric
+        ("methane", -0.1, 1.1),  # Negative flow rate
+        ("methane", 0.0, 1.1),  # Zero flow rate
+        ("invalid_fuel", 0.1, 1.1),  # Unsupported fuel
+    )
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up the calculator shared by all tests in the class."""
         # Use correct path to data directory
         data_path = os.path.join(os.path.dirname(__file__), "..", "data", "fuels.json")
-        self.calculator = CombustionCalculator(fuel_data_path=data_path)
-
-    def test_methane_stoichiometric_air(self):
-        """Test stoichiometric air calculation for methane."""
-        fuel_flow_rate = 0.01  # kg/s
-        air_required = self.calculator.calculate_stoichiometric_air(
-            "methane", fuel_flow_rate
-        )
-
-        # Check basic properties
-        self.assertIsInstance(air_required, float)
-        self.assertGreater(air_required, 0)
+        cls.calculator = CombustionCalculator(fuel_data_path=data_path)
 
-        # Verify methane stoichiometry: CH4 + 2O2 -> CO2 + 2H2O
-        # Theoretical air/fuel ratio for methane ≈ 17.2 kg air/kg fuel
-        expected_air = fuel_flow_rate * 17.23
-        self.assertAlmostEqual(air_required, expected_air, places=3)
-
-    def test_propane_stoichiometric_air(self):
-        """Test stoichiometric air calculation for propane."""
+    def test_stoichiometric_air(self):
+        """Test stoichiometric air calculation for each supported fuel."""
         fuel_flow_rate = 0.01  # kg/s
-        air_required = self.calculator.calculate_stoichiometric_air(
-            "propane", fuel_flow_rate
+        cases = (
+            # Methane: CH4 + 2O2 -> CO2 + 2H2O, air/fuel ratio ≈ 17.2
+            ("methane", 17.23, 5e-4),
+            # Propane: air/fuel ratio ≈ 15.6, actual value from fuel data
+            ("propane", 15.5, 5e-3),
+            # Natural gas is mostly methane, so similar ratio around 16.5
+            ("natural_gas", 16.5, fuel_flow_rate),
         )
 
-        # Check basic properties
-        self.assertIsInstance(air_required, float)
-        self.assertGreater(air_required, 0)
-
-        # Theoretical air/fuel ratio for propane ≈ 15.6 kg air/kg fuel
-        expected_air = fuel_flow_rate * 15.5  # Use actual value from fuel data
-        self.assertAlmostEqual(air_required, expected_air, places=2)
-
-    def test_natural_gas_stoichiometric_air(self):
-        """Test stoichiometric air calculation for natural gas."""
-        fuel_flow_rate = 0.01  # kg/s
-        air_required = self.calculator.calculate_stoichiometric_air(
-            "natural_gas", fuel_flow_rate
-        )
+        for fuel_type, air_fuel_ratio, tolerance in cases:
+            with self.subTest(fuel_type=fuel_type):
+                air_required = self.calculator.calculate_stoichiometric_air(
+                    fuel_type, fuel_flow_rate
+                )
+
+                # Check basic properties
+                self.assertIsInstance(air_required, float)
+                self.assertGreater(air_required, 0)
+
+                self.assertAlmostEqual(
+                    air_required, fuel_flow_rate * air_fuel_ratio, delta=tolerance
+                )
+
+    def test_stoichiometric_air_batch(self):
+        """Test that the batch air calculation matches the scalar version."""
+        fuel_flow_rates = np.array([0.01, 0.02, 0.05])  # kg/s
+
+        for fuel_type in ("methane", "propane", "natural_gas"):
+            with self.subTest(fuel_type=fuel_type):
+                air_required = self.calculator.calculate_stoichiometric_air_batch(
+                    fuel_type, fuel_flow_rates
+                )
+                expected = [
+                    self.calculator.calculate_stoichiometric_air(fuel_type, flow)
+                    for flow in fuel_flow_rates
+                ]
+                np.testing.assert_allclose(air_required, expected, rtol=1e-12)
 
-        # Check basic properties
-        self.assertIsInstance(air_required, float)
-        self.assertGreater(air_required, 0)
-
-        # Natural gas is mostly methane, so similar ratio
-        # Expected air/fuel ratio around 16.5
-        expected_air = fuel_flow_rate * 16.5
-        self.assertAlmostEqual(air_required, expected_air, delta=fuel_flow_rate)
+        with self.assertRaises(ValueError):
+            self.calculator.calculate_stoichiometric_air_batch(
+                "invalid_fuel", fuel_flow_rates
+            )
 
     def test_combustion_products(self):
         """Test combustion products calculation."""
@@ -79,14 +89,21 @@ class TestCombustionCalculator(unittest.TestCase):
         )
 
         # Check result structure
-        self.assertIsInstance(result, object)
-        self.assertTrue(hasattr(result, "fuel_flow_rate"))
-        self.assertTrue(hasattr(result, "air_flow_rate"))
-        self.assertTrue(hasattr(result, "flue_gas_flow_rate"))  # Correct attribute name
-        self.assertTrue(hasattr(result, "adiabatic_flame_temperature"))
-        self.assertTrue(hasattr(result, "heat_release_rate"))
-        self.assertTrue(hasattr(result, "co2_volume_percent"))
-        self.assertTrue(hasattr(result, "o2_volume_percent"))
+        required = {
+            "fuel_flow_rate",
+            "air_flow_rate",
+            "flue_gas_flow_rate",
+            "adiabatic_flame_temperature",
+            "heat_release_rate",
+            "co2_volume_percent",
+            "o2_volume_percent",
+        }
+        self.assertIsInstance(result, CombustionResults)
+        self.assertLessEqual(required, {field.name for field in fields(result)})
+
+        # Results are immutable so they can be shared between tests and workers
+        with self.assertRaises(AttributeError):
+            result.fuel_flow_rate = 0.2
 
         # Check values
         self.assertEqual(result.fuel_flow_rate, 0.1)
@@ -97,6 +114,33 @@ class TestCombustionCalculator(unittest.TestCase):
         self.assertGreater(result.co2_volume_percent, 0)
         self.assertGreater(result.o2_volume_percent, 0)
 
+    def test_combustion_products_batch(self):
+        """Test that the batch products calculation matches scalar results."""
+        excess_air_ratios = np.array([1.1, 1.2, 1.5, 2.0])
+
+        batch = self.calculator.calculate_combustion_products_batch(
+            "natural_gas", 0.01, excess_air_ratios
+        )
+
+        self.assertEqual(
+            list(batch), [field.name for field in fields(CombustionResults)]
+        )
+        singles = [
+            self.calculator.calculate_combustion_products(
+                "natural_gas", 0.01, excess_air_ratio=float(ratio)
+            )
+            for ratio in excess_air_ratios
+        ]
+        for field, values in batch.items():
+            with self.subTest(field=field):
+                expected = [getattr(result, field) for result in singles]
+                np.testing.assert_allclose(values, expected, rtol=1e-12)
+
+        with self.assertRaises(ValueError):
+            self.calculator.calculate_combustion_products_batch(
+                "natural_gas", 0.01, np.array([1.2, 0.8])
+            )
+
     def test_temperature_calculation(self):
         """Test adiabatic flame temperature calculation."""
         temperature = self.calculator._calculate_adiabatic_temperature(
@@ -112,13 +156,18 @@ class TestCombustionCalculator(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.calculator.calculate_stoichiometric_air("invalid_fuel", 0.01)
 
-    def test_excess_air_validation(self):
-        """Test validation of excess air ratio."""
-        # Test minimum excess air ratio
-        with self.assertRaises(ValueError):
-            self.calculator.calculate_combustion_products(
-                "methane", 0.1, excess_air_ratio=0.8
-            )
+    def test_input_validation(self):
+        """Test validation of excess air ratio and fuel flow rate."""
+        for fuel_type, fuel_flow_rate, excess_air_ratio in self._INVALID_INPUTS:
+            with self.subTest(
+                fuel_type=fuel_type,
+                fuel_flow_rate=fuel_flow_rate,
+                excess_air_ratio=excess_air_ratio,
+            ):
+                with self.assertRaises(ValueError):
+                    self.calculator.calculate_combustion_products(
+                        fuel_type, fuel_flow_rate, excess_air_ratio=excess_air_ratio
+                    )
 
         # Test valid excess air ratio should work
         result = self.calculator.calculate_combustion_products(
@@ -127,20 +176,6 @@ class TestCombustionCalculator(unittest.TestCase):
         self.assertIsNotNone(result)
         self.assertEqual(result.excess_air_ratio, 2.0)
 
-    def test_fuel_flow_rate_validation(self):
-        """Test validation of fuel flow rate."""
-        # Test negative flow rate
-        with self.assertRaises(ValueError):
-            self.calculator.calculate_combustion_products(
-                "methane", -0.1, excess_air_ratio=1.1
-            )
-
-        # Test zero flow rate
-        with self.assertRaises(ValueError):
-            self.calculator.calculate_combustion_products(
-                "methane", 0.0, excess_air_ratio=1.1
-            )
-
     def test_get_fuel_properties(self):
         """Test getting fuel properties."""
         props = self.calculator.get_fuel_properties("methane")
@@ -148,6 +183,36 @@ class TestCombustionCalculator(unittest.TestCase):
         self.assertIn("name", props)
         self.assertIn("properties", props)
 
+    def test_fuel_data_isolated_per_calculator(self):
+        """Test that editing one calculator's fuel data leaves others intact."""
+        data_path = os.path.join(os.path.dirname(__file__), "..", "data", "fuels.json")
+        first = CombustionCalculator(fuel_data_path=data_path)
+        first.get_fuel_properties("methane")["properties"]["molecular_weight"] = 0.0
+
+        other = CombustionCalculator(fuel_data_path=data_path)
+        self.assertEqual(other.fuel_data, self.calculator.fuel_data)
+        self.assertNotEqual(
+            other.get_fuel_properties("methane")["properties"]["molecular_weight"],
+            0.0,
+        )
+
+    def test_fuel_data_reloaded_after_change(self):
+        """Test that an edited fuel data file is parsed again."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            data_path = os.path.join(temp_dir, "fuels.json")
+            with open(data_path, "w", encoding="utf-8") as f:
+                json.dump({"fuels": {}, "constants": {"version": 1}}, f)
+            first = CombustionCalculator(fuel_data_path=data_path)
+
+            with open(data_path, "w", encoding="utf-8") as f:
+                json.dump({"fuels": {}, "constants": {"version": 2}}, f)
+            stat = os.stat(data_path)
+            os.utime(data_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+            second = CombustionCalculator(fuel_data_path=data_path)
+
+        self.assertEqual(first.constants["version"], 1)
+        self.assertEqual(second.constants["version"], 2)
+
     def test_get_available_fuels(self):
         """Test getting available fuel types."""
         fuels = self.calculator.get_available_fuels()
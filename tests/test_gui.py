@@ -10,37 +10,215 @@ Tests GUI initialization, input validation, calculation orchestration, and file
 import json
 import os
 import sys
+import tempfile
+import types
 import unittest
-from unittest.mock import Mock, patch, MagicMock, mock_open
+from unittest.mock import Mock, patch
 
-# Add src and gui directories to path for imports  # noqa: E402
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+# Add gui directory to path for imports (src/ is set up by the tests package)
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "gui"))
 
-# Mock tkinter and calculation modules before importing GUI module
+# Mock tkinter and calculation modules before importing GUI module. The module
+# is imported once and kept, because patch.dict drops it from sys.modules on
+# exit; tests patch this object so they reach the globals the class uses.
 with patch.dict(
     "sys.modules",
     {
-        "tkinter": MagicMock(),
-        "tkinter.ttk": MagicMock(),
-        "tkinter.filedialog": MagicMock(),
-        "tkinter.messagebox": MagicMock(),
-        "tkinter.scrolledtext": MagicMock(),
-        "pandas": MagicMock(),
-        "combustion": MagicMock(),
-        "burner_design": MagicMock(),
-        "chamber_design": MagicMock(),
-        "radiation": MagicMock(),
-        "pressure_losses": MagicMock(),
-        "visualization": MagicMock(),
+        "tkinter": Mock(),
+        "tkinter.ttk": Mock(),
+        "tkinter.filedialog": Mock(),
+        "tkinter.messagebox": Mock(),
+        "tkinter.scrolledtext": Mock(),
+        # gui only touches pandas inside the Excel export, never at import
+        "pandas": types.ModuleType("pandas"),
+        "combustion": Mock(),
+        "burner_design": Mock(),
+        "chamber_design": Mock(),
+        "radiation": Mock(),
+        "pressure_losses": Mock(),
+        "visualization": Mock(),
     },
 ):
-    from gui import BurnerCalculatorGUI  # noqa: E402
+    import gui as gui_module
+
+BurnerCalculatorGUI = gui_module.BurnerCalculatorGUI
+
+
+def _new_gui(**attributes):
+    """
+    Create a BurnerCalculatorGUI without building any widgets.
+
+    The instance gets the state that __init__ and create_widgets provide
+    (mocked root window and progress bar, empty data stores); keyword
+    arguments override or add attributes. Callbacks scheduled with
+    root.after run immediately, as if the Tk event loop had processed them.
+    """
+    gui = BurnerCalculatorGUI.__new__(BurnerCalculatorGUI)
+    gui.root = Mock()
+    gui.root.winfo_children.return_value = []
+    gui.root.after.side_effect = lambda delay, callback, *args: callback(*args)
+    gui.progress = Mock()
+    gui.input_vars = {}
+    gui.input_data = {}
+    gui.results = {}
+    gui.validation_errors = []
+    gui.calculators = {}
+    gui.__dict__.update(attributes)
+    return gui
+
+
+# Main calculation method of each calculator, used to wire mocked results
+_CALCULATOR_METHODS = {
+    "combustion": "calculate_combustion_products",
+    "burner": "design_burner",
+    "chamber": "design_chamber",
+    "radiation": "calculate_flame_radiation",
+    "pressure": "calculate_system_pressure_losses",
+}
+
+# Plain result stand-ins carrying only the attributes _perform_calculations reads
+_CALCULATOR_RESULTS = {
+    "combustion": types.SimpleNamespace(
+        adiabatic_flame_temperature=2100,
+        heat_release_rate=100000,
+        excess_air_ratio=1.2,
+        flue_gas_flow_rate=0.04,
+    ),
+    "burner": types.SimpleNamespace(burner_diameter=0.05),
+    "chamber": types.SimpleNamespace(
+        chamber_wall_temperature=1200,
+        chamber_diameter=0.4,
+        chamber_length=1.2,
+    ),
+    "radiation": types.SimpleNamespace(),
+    "pressure": types.SimpleNamespace(),
+}
+
+
+def _mock_calculators(results=None):
+    """
+    Create mocked calculators keyed like BurnerCalculatorGUI.calculators.
+
+    Args:
+        results (dict, optional): Result returned by each calculator's main
+            calculation method, keyed by calculator name
+    """
+    calculators = {
+        "combustion": Mock(),
+        "burner": Mock(),
+        "chamber": Mock(),
+        "radiation": Mock(),
+        "pressure": Mock(),
+    }
+
+    # Mock available fuels
+    calculators["combustion"].get_available_fuels.return_value = [
+        "natural_gas",
+        "propane",
+        "methane",
+    ]
+    # Gas properties read for the pressure loss calculation
+    calculators["combustion"].get_fuel_properties.return_value = {
+        "properties": {"molecular_weight": 17.4}
+    }
+    calculators["combustion"].constants = {"universal_gas_constant": 8.314}
+
+    for name, result in (results or {}).items():
+        getattr(calculators[name], _CALCULATOR_METHODS[name]).return_value = result
+
+    return calculators
+
+
+class _SyncThread:
+    """Stand-in for threading.Thread that runs its target on start()."""
+
+    def __init__(self, target=None, **kwargs):
+        self.target = target
+        self.daemon = False
+
+    def start(self):
+        self.target()
+
+
+class _StubEntry:
+    """Lightweight stand-in for a ttk.Entry that records its edits."""
+
+    __slots__ = ("value", "calls")
+
+    def __init__(self, value=""):
+        self.value = value
+        self.calls = []
+
+    def get(self):
+        return self.value
+
+    def delete(self, first, last=None):
+        self.calls.append(("delete", first))
+        self.value = ""
+
+    def insert(self, index, value):
+        self.calls.append(("insert", index, value))
+        self.value = value
+
+
+class _StubCombobox(_StubEntry):
+    """Lightweight stand-in for a ttk.Combobox that records its edits."""
+
+    __slots__ = ()
+
+    def set(self, value):
+        self.calls.append(("set", value))
+        self.value = value
 
 
 class TestBurnerCalculatorGUI(unittest.TestCase):
     """Test cases for BurnerCalculatorGUI class."""
 
+    # Validation inputs (read-only, shared by all tests)
+    _VALID_INPUT_DATA = {
+        "fuel_flow_rate": 0.002,
+        "excess_air_ratio": 1.2,
+        "ambient_temperature": 293.15,
+        "ambient_pressure": 101325,
+        "max_gas_velocity": 25,
+        "supply_pressure": 3000,
+        "heat_output": 100000,
+        "max_chamber_temp": 1200,
+    }
+
+    # Every value out of range
+    _INVALID_INPUT_DATA = {
+        "fuel_flow_rate": -0.002,  # Invalid: negative
+        "excess_air_ratio": 0.5,  # Invalid: too low
+        "ambient_temperature": 200,  # Invalid: too low (in K)
+        "ambient_pressure": -1000,  # Invalid: negative
+        "max_gas_velocity": -10,  # Invalid: negative
+        "supply_pressure": -100,  # Invalid: negative
+        "heat_output": -100000,  # Invalid: negative
+        "max_chamber_temp": 100,  # Invalid: too low
+    }
+
+    # Boundary values that are still valid
+    _EDGE_CASE_INPUT_DATA = {
+        "fuel_flow_rate": 0.0001,  # Very small but positive
+        "excess_air_ratio": 1.0,  # Minimum stoichiometric
+        "ambient_temperature": 223.15,  # -50°C (cold but valid)
+        "ambient_pressure": 50000,  # Low pressure but positive
+        "max_gas_velocity": 1.0,  # Minimum valid speed
+        "supply_pressure": 1000,  # Minimum valid pressure
+        "heat_output": 1000,  # Small but positive
+        "max_chamber_temp": 500,  # 500°C (minimum valid temp)
+    }
+
+    # Saved input file contents, serialized once
+    _INPUT_FILE_JSON = json.dumps(
+        {
+            "fuel_type": "propane",
+            "fuel_flow_rate": 0.003,
+            "excess_air_ratio": 1.3,
+        }
+    )
+
     def setUp(self):
         """Set up test fixtures."""
         # Mock tkinter components
@@ -51,37 +229,22 @@ class TestBurnerCalculatorGUI(unittest.TestCase):
         self.mock_root.columnconfigure = Mock()
         self.mock_root.rowconfigure = Mock()
 
-        # Mock all calculators
-        self.mock_calculators = {
-            "combustion": Mock(),
-            "burner": Mock(),
-            "chamber": Mock(),
-            "radiation": Mock(),
-            "pressure": Mock(),
-        }
-
-        # Mock available fuels
-        self.mock_calculators["combustion"].get_available_fuels.return_value = [
-            "natural_gas",
-            "propane",
-            "methane",
-        ]
-
-    @patch("gui.gui.CombustionCalculator")
-    @patch("gui.gui.BurnerDesigner")
-    @patch("gui.gui.ChamberDesigner")
-    @patch("gui.gui.RadiationCalculator")
-    @patch("gui.gui.PressureLossCalculator")
+    @patch.object(gui_module, "CombustionCalculator")
+    @patch.object(gui_module, "BurnerDesigner")
+    @patch.object(gui_module, "ChamberDesigner")
+    @patch.object(gui_module, "RadiationCalculator")
+    @patch.object(gui_module, "PressureLossCalculator")
     def test_initialization_success(
         self, mock_pressure, mock_radiation, mock_chamber, mock_burner, mock_combustion
     ):
         """Test successful GUI initialization."""
         # Setup mocks
-        mock_combustion.return_value = self.mock_calculators["combustion"]
-        mock_burner.return_value = self.mock_calculators["burner"]
-        mock_chamber.return_value = self.mock_calculators["chamber"]
-        mock_radiation.return_value = self.mock_calculators["radiation"]
-        mock_pressure.return_value = self.mock_calculators["pressure"]
+        calculators = _mock_calculators()
+        mock_combustion.return_value = calculators["combustion"]
+        mock_burner.return_value = calculators["burner"]
+        mock_chamber.return_value = calculators["chamber"]
+        mock_radiation.return_value = calculators["radiation"]
+        mock_pressure.return_value = calculators["pressure"]
 
         # Tkinter widgets are already mocked at module level
 
@@ -102,13 +265,11 @@ class TestBurnerCalculatorGUI(unittest.TestCase):
         mock_radiation.assert_called_once()
         mock_pressure.assert_called_once()
 
-    @patch("gui.gui.messagebox")
-    @patch("gui.gui.CombustionCalculator", side_effect=Exception("Calculator error"))
-    @patch("gui.gui.ttk")
-    @patch("gui.gui.tk")
-    def test_initialization_calculator_error(
-        self, mock_tk, mock_ttk, mock_combustion, mock_messagebox
-    ):
+    @patch.object(gui_module, "messagebox")
+    @patch.object(
+        gui_module, "CombustionCalculator", side_effect=Exception("Calculator error")
+    )
+    def test_initialization_calculator_error(self, mock_combustion, mock_messagebox):
         """Test GUI initialization with calculator error."""
         # Create GUI instance
         BurnerCalculatorGUI(self.mock_root)
@@ -117,598 +278,476 @@ class TestBurnerCalculatorGUI(unittest.TestCase):
         mock_messagebox.showerror.assert_called_once()
         self.assertIn("Chyba inicializace", mock_messagebox.showerror.call_args[0][0])
 
-    @patch("gui.gui.ttk")
-    @patch("gui.gui.tk")
-    def test_create_widgets(self, mock_tk, mock_ttk):
+    def test_create_widgets(self):
         """Test widget creation."""
-        # Setup mocks
-        mock_frame = Mock()
-        mock_ttk.Frame.return_value = mock_frame
-        mock_ttk.Notebook.return_value = Mock()
-        mock_ttk.Label.return_value = Mock()
-
-        with patch.object(BurnerCalculatorGUI, "__init__", lambda x, y: None):
-            gui = BurnerCalculatorGUI.__new__(BurnerCalculatorGUI)
-            gui.root = self.mock_root
-            gui.calculators = self.mock_calculators
-            gui.input_data = {}
-            gui.results = {}
-            gui.validation_errors = []
-
-            # Mock required methods
-            gui.create_input_tab = Mock()
-            gui.create_combustion_tab = Mock()
-            gui.create_burner_tab = Mock()
-            gui.create_chamber_tab = Mock()
-            gui.create_radiation_tab = Mock()
-            gui.create_pressure_tab = Mock()
-            gui.create_results_tab = Mock()
-            gui.create_control_buttons = Mock()
-            gui.setup_menu = Mock()
-            gui.load_default_values = Mock()
-
-            # Call method
-            gui.create_widgets()
-
-            # Verify widget creation calls
-            mock_ttk.Frame.assert_called()
-            gui.create_input_tab.assert_called_once()
-            gui.create_combustion_tab.assert_called_once()
-            gui.create_burner_tab.assert_called_once()
-            gui.create_chamber_tab.assert_called_once()
-            gui.create_radiation_tab.assert_called_once()
-            gui.create_pressure_tab.assert_called_once()
-            gui.create_results_tab.assert_called_once()
-            gui.create_control_buttons.assert_called_once()
+        # ttk is already mocked at import time; start from a clean call record
+        mock_ttk = gui_module.ttk
+        mock_ttk.Frame.reset_mock()
+
+        gui = _new_gui()
+        gui.root = self.mock_root
+        gui.calculators = _mock_calculators()
+
+        # Mock required methods
+        gui.create_input_tab = Mock()
+        gui.create_combustion_tab = Mock()
+        gui.create_burner_tab = Mock()
+        gui.create_chamber_tab = Mock()
+        gui.create_radiation_tab = Mock()
+        gui.create_pressure_tab = Mock()
+        gui.create_results_tab = Mock()
+        gui.create_control_buttons = Mock()
+        gui.setup_menu = Mock()
+        gui.load_default_values = Mock()
+
+        # Call method
+        gui.create_widgets()
+
+        # Verify widget creation calls
+        mock_ttk.Frame.assert_called()
+        gui.create_input_tab.assert_called_once()
+        gui.create_combustion_tab.assert_called_once()
+        gui.create_burner_tab.assert_called_once()
+        gui.create_chamber_tab.assert_called_once()
+        gui.create_radiation_tab.assert_called_once()
+        gui.create_pressure_tab.assert_called_once()
+        gui.create_results_tab.assert_called_once()
+        gui.create_control_buttons.assert_called_once()
 
     def test_load_default_values(self):
         """Test loading of default values."""
-        with patch.object(BurnerCalculatorGUI, "__init__", lambda x, y: None):
-            gui = BurnerCalculatorGUI.__new__(BurnerCalculatorGUI)
-            gui.input_vars = {
-                "fuel_type": Mock(),
-                "fuel_flow_rate": Mock(),
-                "excess_air_ratio": Mock(),
-                "ambient_temperature": Mock(),
-                "ambient_pressure": Mock(),
-                "max_gas_velocity": Mock(),
-                "supply_pressure": Mock(),
-                "heat_output": Mock(),
-                "max_chamber_temp": Mock(),
-            }
+        gui = _new_gui()
+        gui.input_vars = {
+            "fuel_type": _StubCombobox(),
+            "fuel_flow_rate": _StubEntry(),
+            "excess_air_ratio": _StubEntry(),
+            "ambient_temperature": _StubEntry(),
+            "ambient_pressure": _StubEntry(),
+            "max_gas_velocity": _StubEntry(),
+            "supply_pressure": _StubEntry(),
+            "heat_output": _StubEntry(),
+            "max_chamber_temp": _StubEntry(),
+        }
 
-            # Call method
-            gui.load_default_values()
+        # Call method
+        gui.load_default_values()
 
-            # Verify default values are set (method may use set or insert depending on widget type)
-            gui.input_vars["fuel_type"].set.assert_called_with("natural_gas")
-            # For other fields, we just verify the method was called
-            self.assertTrue(gui.input_vars["fuel_flow_rate"].set.called or gui.input_vars["fuel_flow_rate"].insert.called)
+        # Verify default values are set (combobox uses set, entries insert)
+        self.assertEqual(gui.input_vars["fuel_type"].calls, [("set", "natural_gas")])
+        self.assertEqual(
+            {key: widget.get() for key, widget in gui.input_vars.items()},
+            {
+                "fuel_type": "natural_gas",
+                "fuel_flow_rate": "0.002",
+                "excess_air_ratio": "1.2",
+                "ambient_temperature": "20",
+                "ambient_pressure": "101325",
+                "max_gas_velocity": "50",
+                "supply_pressure": "3000",
+                "heat_output": "100",
+                "max_chamber_temp": "1200",
+            },
+        )
 
     def test_collect_input_data(self):
         """Test input data collection."""
-        with patch.object(BurnerCalculatorGUI, "__init__", lambda x, y: None):
-            gui = BurnerCalculatorGUI.__new__(BurnerCalculatorGUI)
-            gui.input_vars = {
-                "fuel_type": Mock(),
-                "fuel_flow_rate": Mock(),
-                "excess_air_ratio": Mock(),
-                "ambient_temperature": Mock(),
-                "ambient_pressure": Mock(),
-                "max_gas_velocity": Mock(),
-                "supply_pressure": Mock(),
-                "heat_output": Mock(),
-                "max_chamber_temp": Mock(),
-            }
-
-            # Mock widget get methods
-            gui.input_vars["fuel_type"].get.return_value = "natural_gas"
-            gui.input_vars["fuel_flow_rate"].get.return_value = "0.002"
-            gui.input_vars["excess_air_ratio"].get.return_value = "1.2"
-            gui.input_vars["ambient_temperature"].get.return_value = "20"
-            gui.input_vars["ambient_pressure"].get.return_value = "101325"
-            gui.input_vars["max_gas_velocity"].get.return_value = "25"
-            gui.input_vars["supply_pressure"].get.return_value = "3000"
-            gui.input_vars["heat_output"].get.return_value = "100000"
-            gui.input_vars["max_chamber_temp"].get.return_value = "1200"
+        gui = _new_gui()
+        # Widgets holding string values
+        gui.input_vars = {
+            "fuel_type": _StubCombobox("natural_gas"),
+            "fuel_flow_rate": _StubEntry("0.002"),
+            "excess_air_ratio": _StubEntry("1.2"),
+            "ambient_temperature": _StubEntry("20"),
+            "ambient_pressure": _StubEntry("101325"),
+            "max_gas_velocity": _StubEntry("25"),
+            "supply_pressure": _StubEntry("3000"),
+            "heat_output": _StubEntry("100000"),
+            "max_chamber_temp": _StubEntry("1200"),
+        }
 
-            # Call method
-            result = gui.collect_input_data()
-
-            # Verify collected data
-            self.assertEqual(result["fuel_type"], "natural_gas")
-            self.assertEqual(result["fuel_flow_rate"], 0.002)
-            self.assertEqual(result["excess_air_ratio"], 1.2)
-            self.assertEqual(result["ambient_temperature"], 293.15)  # Converted to K
-            self.assertEqual(result["ambient_pressure"], 101325)
-            self.assertEqual(result["max_gas_velocity"], 25)
-            self.assertEqual(result["supply_pressure"], 3000)
-            self.assertEqual(result["heat_output"], 100000)
-            self.assertEqual(result["max_chamber_temp"], 1200.0)  # NOT converted to K
-
-    def test_validate_input_valid(self):
-        """Test input validation with valid data."""
-        with patch.object(BurnerCalculatorGUI, "__init__", lambda x, y: None):
-            gui = BurnerCalculatorGUI.__new__(BurnerCalculatorGUI)
-            gui.validation_errors = []
-            gui.input_data = {
+        # Call method
+        result = gui.collect_input_data()
+
+        # Verify collected data
+        self.assertEqual(
+            result,
+            {
+                "fuel_type": "natural_gas",
                 "fuel_flow_rate": 0.002,
                 "excess_air_ratio": 1.2,
-                "ambient_temperature": 293.15,
+                "ambient_temperature": 293.15,  # Converted to K
                 "ambient_pressure": 101325,
                 "max_gas_velocity": 25,
                 "supply_pressure": 3000,
                 "heat_output": 100000,
-                "max_chamber_temp": 1200,
-            }
+                "max_chamber_temp": 1200.0,  # NOT converted to K
+            },
+        )
+
+    def test_validate_input(self):
+        """Test input validation with valid, boundary and invalid data."""
+        cases = (
+            ("valid", self._VALID_INPUT_DATA, True),
+            ("edge_cases", self._EDGE_CASE_INPUT_DATA, True),
+            ("invalid", self._INVALID_INPUT_DATA, False),
+        )
+        # validate_input resets validation_errors itself, so one instance
+        # serves every case once its input_data is swapped
+        gui = _new_gui()
+
+        for name, input_data, expected_valid in cases:
+            with self.subTest(input_data=name):
+                gui.input_data = input_data
 
-            # Call method
-            result = gui.validate_input()
-
-            # Should be valid
-            self.assertTrue(result)
-            self.assertEqual(len(gui.validation_errors), 0)
-
-    def test_validate_input_invalid(self):
-        """Test input validation with invalid data."""
-        with patch.object(BurnerCalculatorGUI, "__init__", lambda x, y: None):
-            gui = BurnerCalculatorGUI.__new__(BurnerCalculatorGUI)
-            gui.validation_errors = []
-            gui.input_data = {
-                "fuel_flow_rate": -0.002,  # Invalid: negative
-                "excess_air_ratio": 0.5,  # Invalid: too low
-                "ambient_temperature": 200,  # Invalid: too low
-                "ambient_pressure": -1000,  # Invalid: negative
-                "max_gas_velocity": -10,  # Invalid: negative
-                "supply_pressure": -100,  # Invalid: negative
-                "heat_output": -100000,  # Invalid: negative
-                "max_chamber_temp": 100,  # Invalid: too low
-            }
-
-            # Call method
-            result = gui.validate_input()
-
-            # Should be invalid
-            self.assertFalse(result)
-            self.assertGreater(len(gui.validation_errors), 0)
-
-    @patch("gui.gui.threading.Thread")
-    def test_run_calculations(self, mock_thread):
+                # Call method
+                result = gui.validate_input()
+
+                self.assertEqual(result, expected_valid)
+                if expected_valid:
+                    self.assertEqual(gui.validation_errors, [])
+                else:
+                    # Validation accumulates all errors instead of stopping early
+                    self.assertGreaterEqual(len(gui.validation_errors), 5)
+
+    @patch.object(gui_module, "messagebox")
+    @patch.object(gui_module.threading, "Thread", _SyncThread)
+    def test_run_calculations(self, mock_messagebox):
         """Test calculation execution."""
-        with patch.object(BurnerCalculatorGUI, "__init__", lambda x, y: None):
-            gui = BurnerCalculatorGUI.__new__(BurnerCalculatorGUI)
-            gui.collect_input_data = Mock(return_value={"fuel_type": "natural_gas"})
-            gui.validate_input = Mock(return_value=True)
-            gui._update_status = Mock()
+        gui = _new_gui(input_data=dict(self._VALID_INPUT_DATA))
+        gui._perform_calculations = Mock()
 
-            # Mock thread
-            mock_thread_instance = Mock()
-            mock_thread.return_value = mock_thread_instance
+        # Call method
+        gui.run_calculations()
 
-            # Call method
-            gui.run_calculations()
-
-            # Verify thread creation and start
-            mock_thread.assert_called_once()
-            mock_thread_instance.start.assert_called_once()
-            gui._update_status.assert_called_with("Probíhají výpočty...")
+        # Verify progress started and calculations ran in the worker thread
+        mock_messagebox.showerror.assert_not_called()
+        gui.progress.start.assert_called_once()
+        gui._perform_calculations.assert_called_once()
 
-    @patch("gui.gui.messagebox")
+    @patch.object(gui_module, "messagebox")
+    @patch.object(gui_module.threading, "Thread", _SyncThread)
     def test_run_calculations_validation_error(self, mock_messagebox):
         """Test calculation execution with validation errors."""
-        with patch.object(BurnerCalculatorGUI, "__init__", lambda x, y: None):
-            gui = BurnerCalculatorGUI.__new__(BurnerCalculatorGUI)
-            gui.collect_input_data = Mock(return_value={})
-            gui.validate_input = Mock(return_value=False)
-            gui.validation_errors = ["Error 1", "Error 2"]
+        gui = _new_gui(input_data=dict(self._INVALID_INPUT_DATA))
+        gui._perform_calculations = Mock()
 
-            # Call method
-            gui.run_calculations()
+        # Call method
+        gui.run_calculations()
+
+        # Verify error message lists every validation error
+        mock_messagebox.showerror.assert_called_once()
+        error_args = mock_messagebox.showerror.call_args[0]
+        self.assertIn("Chyby ve vstupních datech", error_args[0])
+        for error in gui.validation_errors:
+            self.assertIn(error, error_args[1])
 
-            # Verify error message
-            mock_messagebox.showerror.assert_called_once()
-            error_args = mock_messagebox.showerror.call_args[0]
-            self.assertIn("Chybné vstupní", error_args[0])
-            self.assertIn("Error 1", error_args[1])
-            self.assertIn("Error 2", error_args[1])
+        # Calculations never start
+        gui.progress.start.assert_not_called()
+        gui._perform_calculations.assert_not_called()
 
     def test_perform_calculations_success(self):
         """Test successful calculation execution."""
-        with patch.object(BurnerCalculatorGUI, "__init__", lambda x, y: None):
-            gui = BurnerCalculatorGUI.__new__(BurnerCalculatorGUI)
-            gui.input_data = {
-                "fuel_type": "natural_gas",
-                "fuel_flow_rate": 0.002,
-                "excess_air_ratio": 1.2,
-                "ambient_temperature": 293.15,
-                "supply_pressure": 3000,
-                "target_residence_time": 0.5,
-                "wall_insulation_thickness": 0.1,
-                "target_efficiency": 0.85,
-            }
-            gui.results = {}
-            gui._update_status = Mock()
-            gui._calculation_finished = Mock()
-
-            # Mock calculator results
-            mock_combustion_result = Mock()
-            mock_combustion_result.adiabatic_flame_temperature = 2100
-            mock_burner_result = Mock()
-            mock_chamber_result = Mock()
-            mock_radiation_result = Mock()
-
-            gui.calculators = {
-                "combustion": Mock(),
-                "burner": Mock(),
-                "chamber": Mock(),
-                "radiation": Mock(),
-                "pressure": Mock(),
-            }
-
-            gui.calculators["combustion"].calculate_combustion_products.return_value = (
-                mock_combustion_result
-            )
-            gui.calculators["burner"].design_burner.return_value = mock_burner_result
-            gui.calculators["chamber"].design_chamber.return_value = mock_chamber_result
-            gui.calculators["radiation"].calculate_flame_radiation.return_value = (
-                mock_radiation_result
-            )
-
-            # Call method
-            gui._perform_calculations()
-
-            # Verify calculations were called
-            gui.calculators[
-                "combustion"
-            ].calculate_combustion_products.assert_called_once()
-            gui.calculators["burner"].design_burner.assert_called_once()
-            gui.calculators["chamber"].design_chamber.assert_called_once()
-            gui.calculators["radiation"].calculate_flame_radiation.assert_called_once()
-
-            # Verify results stored
-            self.assertIn("combustion", gui.results)
-            self.assertIn("burner", gui.results)
-            self.assertIn("chamber", gui.results)
-            self.assertIn("radiation", gui.results)
-
-    def test_perform_calculations_error_handling(self):
+        gui = _new_gui(input_data=dict(self._VALID_INPUT_DATA, fuel_type="natural_gas"))
+        gui._update_status = Mock()
+        gui._display_all_results = Mock()
+        gui._calculation_finished = Mock()
+
+        # Mock calculator results
+        gui.calculators = _mock_calculators(_CALCULATOR_RESULTS)
+
+        # Call method
+        gui._perform_calculations()
+
+        for name, method in _CALCULATOR_METHODS.items():
+            with self.subTest(calculator=name):
+                # Verify calculation was called and its result stored
+                getattr(gui.calculators[name], method).assert_called_once()
+                self.assertIs(gui.results[name], _CALCULATOR_RESULTS[name])
+
+        # Verify status updates and the GUI refresh on the main thread
+        gui._update_status.assert_called_with("Výpočet tlakových ztrát...")
+        gui._display_all_results.assert_called_once()
+        gui._calculation_finished.assert_called_once()
+
+    @patch.object(gui_module, "messagebox")
+    def test_perform_calculations_error_handling(self, mock_messagebox):
         """Test calculation error handling."""
-        with patch.object(BurnerCalculatorGUI, "__init__", lambda x, y: None):
-            gui = BurnerCalculatorGUI.__new__(BurnerCalculatorGUI)
-            gui.input_data = {
-                "fuel_type": "natural_gas",
-                "fuel_flow_rate": 0.002,
-                "excess_air_ratio": 1.2,
-            }
-            gui.results = {}
-            gui._update_status = Mock()
-            gui._calculation_finished = Mock()
-
-            # Mock calculator that raises exception
-            gui.calculators = {
-                "combustion": Mock(),
-                "burner": Mock(),
-                "chamber": Mock(),
-                "radiation": Mock(),
-                "pressure": Mock(),
-            }
-
-            gui.calculators["combustion"].calculate_combustion_products.side_effect = (
-                Exception("Calculation error")
-            )
+        gui = _new_gui(input_data=dict(self._VALID_INPUT_DATA, fuel_type="natural_gas"))
+        gui._update_status = Mock()
+        gui._display_all_results = Mock()
+        gui._calculation_finished = Mock()
 
-            # Call method
-            gui._perform_calculations()
+        # Mock calculator that raises exception
+        gui.calculators = _mock_calculators()
+        gui.calculators["combustion"].calculate_combustion_products.side_effect = (
+            Exception("Calculation error")
+        )
 
-            # Verify error handling
-            self.assertIn("errors", gui.results)
-            self.assertIn("combustion", gui.results["errors"])
+        # Call method
+        gui._perform_calculations()
 
-    @patch("gui.gui.filedialog")
+        # Verify error handling
+        mock_messagebox.showerror.assert_called_once()
+        error_args = mock_messagebox.showerror.call_args[0]
+        self.assertEqual(error_args[0], "Chyba výpočtu")
+        self.assertIn("Calculation error", error_args[1])
+        self.assertNotIn("combustion", gui.results)
+        gui.calculators["burner"].design_burner.assert_not_called()
+        gui._display_all_results.assert_not_called()
+        gui._calculation_finished.assert_called_once()
+
+    @patch.object(gui_module, "filedialog")
     def test_load_input_file_success(self, mock_filedialog):
         """Test successful input file loading."""
-        with patch.object(BurnerCalculatorGUI, "__init__", lambda x, y: None):
-            gui = BurnerCalculatorGUI.__new__(BurnerCalculatorGUI)
-            gui.input_vars = {
-                "fuel_type": Mock(),
-                "fuel_flow_rate": Mock(),
-                "excess_air_ratio": Mock(),
-            }
-
-            # Mock file dialog
-            test_file = "/test/input.json"
-            mock_filedialog.askopenfilename.return_value = test_file
+        gui = _new_gui()
+        gui.input_vars = {
+            "fuel_type": _StubCombobox(),
+            "fuel_flow_rate": _StubEntry(),
+            "excess_air_ratio": _StubEntry(),
+        }
 
-            # Mock file content
-            test_data = {
-                "fuel_type": "propane",
-                "fuel_flow_rate": 0.003,
-                "excess_air_ratio": 1.3,
-            }
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # Input file on disk
+            test_file = os.path.join(temp_dir, "input.json")
+            with open(test_file, "w", encoding="utf-8") as f:
+                f.write(self._INPUT_FILE_JSON)
+            mock_filedialog.askopenfilename.return_value = test_file
 
-            with patch("builtins.open", mock_open(read_data=json.dumps(test_data))):
+            # ttk is mocked, so point Combobox at the stub class
+            with patch.object(gui_module.ttk, "Combobox", _StubCombobox):
                 # Call method
                 gui.load_input_file()
 
-                # Verify data loaded
-                gui.input_vars["fuel_type"].set.assert_called_with("propane")
-                gui.input_vars["fuel_flow_rate"].delete.assert_called()
-                gui.input_vars["fuel_flow_rate"].insert.assert_called_with(0, "0.003")
+        # Verify data loaded
+        self.assertEqual(gui.input_vars["fuel_type"].calls, [("set", "propane")])
+        self.assertEqual(
+            gui.input_vars["fuel_flow_rate"].calls[-1], ("insert", 0, "0.003")
+        )
+        self.assertEqual(gui.input_vars["fuel_flow_rate"].calls[0][0], "delete")
 
-    @patch("gui.gui.filedialog")
-    @patch("gui.gui.messagebox")
+    @patch.object(gui_module, "filedialog")
+    @patch.object(gui_module, "messagebox")
     def test_load_input_file_error(self, mock_messagebox, mock_filedialog):
         """Test input file loading error handling."""
-        with patch.object(BurnerCalculatorGUI, "__init__", lambda x, y: None):
-            gui = BurnerCalculatorGUI.__new__(BurnerCalculatorGUI)
+        gui = _new_gui()
 
-            # Mock file dialog
-            test_file = "/test/invalid.json"
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # File that does not exist
+            test_file = os.path.join(temp_dir, "invalid.json")
             mock_filedialog.askopenfilename.return_value = test_file
 
-            # Mock file error
-            with patch(
-                "builtins.open", side_effect=FileNotFoundError("File not found")
-            ):
-                # Call method
-                gui.load_input_file()
+            # Call method
+            gui.load_input_file()
 
-                # Verify error message
-                mock_messagebox.showerror.assert_called_once()
+        # Verify error message
+        mock_messagebox.showerror.assert_called_once()
 
-    @patch("gui.gui.filedialog")
+    @patch.object(gui_module, "filedialog")
     def test_save_input_file_success(self, mock_filedialog):
         """Test successful input file saving."""
-        with patch.object(BurnerCalculatorGUI, "__init__", lambda x, y: None):
-            gui = BurnerCalculatorGUI.__new__(BurnerCalculatorGUI)
-            gui.collect_input_data = Mock(
-                return_value={"fuel_type": "natural_gas", "fuel_flow_rate": 0.002}
-            )
-
-            # Mock file dialog
-            test_file = "/test/output.json"
+        input_data = {"fuel_type": "natural_gas", "fuel_flow_rate": 0.002}
+        gui = _new_gui(input_data=input_data)
+        gui.collect_input_data = Mock(return_value=input_data)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            test_file = os.path.join(temp_dir, "output.json")
             mock_filedialog.asksaveasfilename.return_value = test_file
 
-            with patch("builtins.open", mock_open()) as mock_file:
-                # Call method
-                gui.save_input_file()
+            # Call method
+            gui.save_input_file()
 
-                # Verify file written
-                mock_file.assert_called_once_with(test_file, "w", encoding="utf-8")
-                mock_file().write.assert_called()
+            # Verify file written
+            with open(test_file, "r", encoding="utf-8") as f:
+                self.assertEqual(json.load(f), input_data)
 
-    @patch("gui.gui.filedialog")
-    @patch("gui.gui.messagebox")
+    @patch.object(gui_module, "filedialog")
+    @patch.object(gui_module, "messagebox")
     def test_save_input_file_error(self, mock_messagebox, mock_filedialog):
         """Test input file saving error handling."""
-        with patch.object(BurnerCalculatorGUI, "__init__", lambda x, y: None):
-            gui = BurnerCalculatorGUI.__new__(BurnerCalculatorGUI)
-            gui.collect_input_data = Mock(return_value={})
+        gui = _new_gui()
+        gui.collect_input_data = Mock(return_value={})
 
-            # Mock file dialog
-            test_file = "/test/output.json"
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # Target directory that does not exist
+            test_file = os.path.join(temp_dir, "missing", "output.json")
             mock_filedialog.asksaveasfilename.return_value = test_file
 
-            # Mock file error
-            with patch(
-                "builtins.open", side_effect=PermissionError("Permission denied")
-            ):
-                # Call method
-                gui.save_input_file()
+            # Call method
+            gui.save_input_file()
 
-                # Verify error message
-                mock_messagebox.showerror.assert_called_once()
+        # Verify error message
+        mock_messagebox.showerror.assert_called_once()
 
-    @patch("gui.gui.filedialog")
-    def test_export_results_success(self, mock_filedialog):
+    @patch.object(gui_module, "ExportDialog")
+    def test_export_results_success(self, mock_export_dialog):
         """Test successful results export."""
-        with patch.object(BurnerCalculatorGUI, "__init__", lambda x, y: None):
-            gui = BurnerCalculatorGUI.__new__(BurnerCalculatorGUI)
-            gui.results = {"combustion": Mock(), "burner": Mock(), "chamber": Mock()}
-
-            # Mock file dialog
-            test_file = "/test/results.txt"
+        gui = _new_gui(input_data={"fuel_type": "natural_gas"})
+        gui.results = {"combustion": Mock(), "burner": Mock(), "chamber": Mock()}
+
+        # Call method
+        gui.export_results()
+
+        # Verify the export dialog receives the current results
+        mock_export_dialog.assert_called_once_with(
+            gui.root, gui.results, gui.input_data
+        )
+
+    @patch.object(gui_module, "filedialog")
+    @patch.object(gui_module, "messagebox")
+    def test_export_dialog_txt(self, mock_messagebox, mock_filedialog):
+        """Test TXT export of results and input data."""
+        dialog = gui_module.ExportDialog.__new__(gui_module.ExportDialog)
+        dialog.results = {"combustion": types.SimpleNamespace(heat_release_rate=1e5)}
+        dialog.input_data = {"fuel_type": "natural_gas"}
+        dialog.dialog = Mock()
+        # Dialog variables holding the selected options
+        dialog.format_var = types.SimpleNamespace(get=lambda: "txt")
+        dialog.include_input = types.SimpleNamespace(get=lambda: True)
+        dialog.include_results = types.SimpleNamespace(get=lambda: True)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            test_file = os.path.join(temp_dir, "results.txt")
             mock_filedialog.asksaveasfilename.return_value = test_file
 
-            with patch("builtins.open", mock_open()) as mock_file:
-                # Call method
-                gui.export_results()
-
-                # Verify file written
-                mock_file.assert_called_once_with(test_file, "w", encoding="utf-8")
-                mock_file().write.assert_called()
-
-    @patch("gui.gui.messagebox")
-    def test_export_results_no_data(self, mock_messagebox):
+            # Call method
+            dialog.export_data()
+
+            # Verify file written
+            with open(test_file, "r", encoding="utf-8") as f:
+                content = f.read()
+
+        self.assertIn("fuel_type: natural_gas", content)
+        self.assertIn("COMBUSTION:", content)
+        self.assertIn("heat_release_rate: 100000.0", content)
+        mock_messagebox.showinfo.assert_called_once()
+        mock_messagebox.showerror.assert_not_called()
+        dialog.dialog.destroy.assert_called_once()
+
+    @patch.object(gui_module, "ExportDialog")
+    @patch.object(gui_module, "messagebox")
+    def test_export_results_no_data(self, mock_messagebox, mock_export_dialog):
         """Test results export with no data."""
-        with patch.object(BurnerCalculatorGUI, "__init__", lambda x, y: None):
-            gui = BurnerCalculatorGUI.__new__(BurnerCalculatorGUI)
-            gui.results = {}
+        gui = _new_gui()
 
-            # Call method
-            gui.export_results()
+        # Call method
+        gui.export_results()
 
-            # Verify warning message
-            mock_messagebox.showwarning.assert_called_once()
-            warning_args = mock_messagebox.showwarning.call_args[0]
-            self.assertIn("žádné výsledky", warning_args[1])
+        # Verify warning message
+        mock_messagebox.showwarning.assert_called_once()
+        warning_args = mock_messagebox.showwarning.call_args[0]
+        self.assertIn("Nejprve spusťte výpočet", warning_args[1])
+        mock_export_dialog.assert_not_called()
 
     def test_update_status(self):
         """Test status update."""
-        with patch.object(BurnerCalculatorGUI, "__init__", lambda x, y: None):
-            gui = BurnerCalculatorGUI.__new__(BurnerCalculatorGUI)
+        gui = _new_gui()
 
-            # Call method (should not raise an exception)
-            result = gui._update_status("Test message")
+        # Call method (should not raise an exception)
+        result = gui._update_status("Test message")
 
-            # Verify method executes without error
-            self.assertIsNone(result)
+        # Verify method executes without error
+        self.assertIsNone(result)
 
-    @patch("gui.gui.messagebox")
+    @patch.object(gui_module, "messagebox")
     def test_calculation_finished_success(self, mock_messagebox):
         """Test calculation finished with success."""
-        with patch.object(BurnerCalculatorGUI, "__init__", lambda x, y: None):
-            gui = BurnerCalculatorGUI.__new__(BurnerCalculatorGUI)
-            gui.results = {"combustion": Mock(), "burner": Mock()}
-            gui._update_status = Mock()
-            gui._display_all_results = Mock()
-            gui.progress = Mock()  # Mock the progress bar
-            gui.root = Mock()  # Mock root for re-enabling buttons
-            gui.root.winfo_children.return_value = []  # Mock empty children list
+        gui = _new_gui()
+        gui.results = {"combustion": Mock(), "burner": Mock()}
+        gui._update_status = Mock()
+        gui._display_all_results = Mock()
 
-            # Call method
-            gui._calculation_finished()
+        # Call method
+        gui._calculation_finished()
 
-            # Verify success handling
-            gui._update_status.assert_called_with("Výpočty dokončeny")
-            gui._display_all_results.assert_called_once()
-            mock_messagebox.showinfo.assert_called_once()
+        # Verify success handling
+        gui._update_status.assert_called_with("Výpočty dokončeny")
+        gui._display_all_results.assert_called_once()
+        mock_messagebox.showinfo.assert_called_once()
 
-    @patch("gui.gui.messagebox")
+    @patch.object(gui_module, "messagebox")
     def test_calculation_finished_with_errors(self, mock_messagebox):
         """Test calculation finished with errors."""
-        with patch.object(BurnerCalculatorGUI, "__init__", lambda x, y: None):
-            gui = BurnerCalculatorGUI.__new__(BurnerCalculatorGUI)
-            gui.results = {"errors": {"combustion": "Error occurred"}}
-            gui._update_status = Mock()
-            gui._display_all_results = Mock()
-            gui.progress = Mock()  # Mock the progress bar
-            gui.root = Mock()  # Mock root for re-enabling buttons
-            gui.root.winfo_children.return_value = []  # Mock empty children list
+        gui = _new_gui()
+        gui.results = {"errors": {"combustion": "Error occurred"}}
+        gui._update_status = Mock()
+        gui._display_all_results = Mock()
 
-            # Call method
-            gui._calculation_finished()
+        # Call method
+        gui._calculation_finished()
 
-            # Verify error handling
-            gui._update_status.assert_called_with("Výpočty dokončeny s chybami")
-            mock_messagebox.showwarning.assert_called_once()
+        # Verify error handling
+        gui._update_status.assert_called_with("Výpočty dokončeny s chybami")
+        mock_messagebox.showwarning.assert_called_once()
 
     def test_display_all_results(self):
         """Test display of all results."""
-        with patch.object(BurnerCalculatorGUI, "__init__", lambda x, y: None):
-            gui = BurnerCalculatorGUI.__new__(BurnerCalculatorGUI)
-            gui.results = {
-                "combustion": Mock(),
-                "burner": Mock(),
-                "chamber": Mock(),
-                "radiation": Mock(),
-            }
-
-            # Mock display methods
-            gui._display_combustion_results = Mock()
-            gui._display_burner_results = Mock()
-            gui._display_chamber_results = Mock()
-            gui._display_radiation_results = Mock()
-            gui._display_pressure_results = Mock()
+        gui = _new_gui()
+        gui.results = {
+            "combustion": Mock(),
+            "burner": Mock(),
+            "chamber": Mock(),
+            "radiation": Mock(),
+        }
 
-            # Call method
-            gui._display_all_results()
+        # Mock display methods
+        gui._display_combustion_results = Mock()
+        gui._display_burner_results = Mock()
+        gui._display_chamber_results = Mock()
+        gui._display_radiation_results = Mock()
+        gui._display_pressure_results = Mock()
 
-            # Verify all display methods called
-            gui._display_combustion_results.assert_called_once()
-            gui._display_burner_results.assert_called_once()
-            gui._display_chamber_results.assert_called_once()
-            gui._display_radiation_results.assert_called_once()
+        # Call method
+        gui._display_all_results()
+
+        # Verify all display methods called
+        gui._display_combustion_results.assert_called_once()
+        gui._display_burner_results.assert_called_once()
+        gui._display_chamber_results.assert_called_once()
+        gui._display_radiation_results.assert_called_once()
 
     def test_clear_results(self):
         """Test clearing of results."""
-        with patch.object(BurnerCalculatorGUI, "__init__", lambda x, y: None):
-            gui = BurnerCalculatorGUI.__new__(BurnerCalculatorGUI)
-            gui.results = {"old_data": "value"}
-            gui.combustion_results_text = Mock()
-            gui.burner_results_text = Mock()
-            gui.chamber_results_text = Mock()
-            gui.radiation_results_text = Mock()
-            gui.pressure_results_text = Mock()
-            gui.overall_results_text = Mock()
-            gui._update_status = Mock()
-
-            # Call method
-            gui.clear_results()
-
-            # Verify results cleared
-            self.assertEqual(gui.results, {})
-            gui.combustion_results_text.delete.assert_called_with("1.0", "end")
-            gui.burner_results_text.delete.assert_called_with("1.0", "end")
-            gui.chamber_results_text.delete.assert_called_with("1.0", "end")
-            gui.radiation_results_text.delete.assert_called_with("1.0", "end")
-            gui.pressure_results_text.delete.assert_called_with("1.0", "end")
-            gui.overall_results_text.delete.assert_called_with("1.0", "end")
+        gui = _new_gui()
+        gui.results = {"old_data": "value"}
+        gui.combustion_results_text = Mock()
+        gui.burner_results_text = Mock()
+        gui.chamber_results_text = Mock()
+        gui.radiation_results_text = Mock()
+        gui.pressure_results_text = Mock()
+        gui.overall_results_text = Mock()
+        gui._update_status = Mock()
+
+        # Call method
+        gui.clear_results()
+
+        # Verify results cleared
+        self.assertEqual(gui.results, {})
+        gui.combustion_results_text.delete.assert_called_with("1.0", "end")
+        gui.burner_results_text.delete.assert_called_with("1.0", "end")
+        gui.chamber_results_text.delete.assert_called_with("1.0", "end")
+        gui.radiation_results_text.delete.assert_called_with("1.0", "end")
+        gui.pressure_results_text.delete.assert_called_with("1.0", "end")
+        gui.overall_results_text.delete.assert_called_with("1.0", "end")
 
     def test_input_data_collection_type_conversion(self):
         """Test proper type conversion in input data collection."""
-        with patch.object(BurnerCalculatorGUI, "__init__", lambda x, y: None):
-            gui = BurnerCalculatorGUI.__new__(BurnerCalculatorGUI)
-            gui.input_vars = {
-                "fuel_type": Mock(),
-                "fuel_flow_rate": Mock(),
-                "excess_air_ratio": Mock(),
-                "ambient_temperature": Mock(),
-            }
-
-            # Mock widget returns with string values
-            gui.input_vars["fuel_type"].get.return_value = "natural_gas"
-            gui.input_vars["fuel_flow_rate"].get.return_value = "0.002"
-            gui.input_vars["excess_air_ratio"].get.return_value = "1.2"
-            gui.input_vars["ambient_temperature"].get.return_value = "25.5"
-
-            # Call method
-            result = gui.collect_input_data()
-
-            # Verify type conversions
-            self.assertIsInstance(result["fuel_flow_rate"], float)
-            self.assertIsInstance(result["excess_air_ratio"], float)
-            self.assertIsInstance(result["ambient_temperature"], float)
-            self.assertEqual(result["ambient_temperature"], 298.65)  # 25.5°C to K
-
-    def test_validation_edge_cases(self):
-        """Test validation with edge case values."""
-        with patch.object(BurnerCalculatorGUI, "__init__", lambda x, y: None):
-            gui = BurnerCalculatorGUI.__new__(BurnerCalculatorGUI)
-            gui.validation_errors = []
-
-            # Test with boundary values
-            gui.input_data = {
-                "fuel_flow_rate": 0.0001,  # Very small but positive
-                "excess_air_ratio": 1.0,  # Minimum stoichiometric
-                "ambient_temperature": 223.15,  # -50°C (cold but valid)
-                "ambient_pressure": 50000,  # Low pressure but positive
-                "max_gas_velocity": 1.0,  # Minimum valid speed
-                "supply_pressure": 1000,  # Minimum valid pressure
-                "heat_output": 1000,  # Small but positive
-                "max_chamber_temp": 500,  # 500°C (minimum valid temp)
-            }
-
-            # Call method
-            result = gui.validate_input()
-
-            # Should still be valid
-            self.assertTrue(result)
-
-    def test_error_accumulation_in_validation(self):
-        """Test that validation accumulates all errors."""
-        with patch.object(BurnerCalculatorGUI, "__init__", lambda x, y: None):
-            gui = BurnerCalculatorGUI.__new__(BurnerCalculatorGUI)
-            gui.validation_errors = []
-
-            # Multiple invalid values
-            gui.input_data = {
-                "fuel_flow_rate": -0.002,  # Invalid: negative
-                "excess_air_ratio": 0.5,  # Invalid: too low
-                "ambient_temperature": 200,  # Invalid: too low (in K)
-                "ambient_pressure": -1000,  # Invalid: negative
-                "max_gas_velocity": -10,  # Invalid: negative
-                "supply_pressure": -100,  # Invalid: negative
-                "heat_output": -100000,  # Invalid: negative
-                "max_chamber_temp": 100,  # Invalid: too low
-            }
+        gui = _new_gui()
+        # Widgets returning string values
+        gui.input_vars = {
+            "fuel_type": _StubCombobox("natural_gas"),
+            "fuel_flow_rate": _StubEntry("0.002"),
+            "excess_air_ratio": _StubEntry("1.2"),
+            "ambient_temperature": _StubEntry("25.5"),
+        }
 
-            # Call method
-            result = gui.validate_input()
+        # Call method
+        result = gui.collect_input_data()
 
-            # Should accumulate multiple errors
-            self.assertFalse(result)
-            self.assertGreaterEqual(len(gui.validation_errors), 5)  # At least 5 errors
+        # Verify type conversions
+        self.assertIsInstance(result["fuel_flow_rate"], float)
+        self.assertIsInstance(result["excess_air_ratio"], float)
+        self.assertIsInstance(result["ambient_temperature"], float)
+        self.assertEqual(result["ambient_temperature"], 298.65)  # 25.5°C to K
 
 
 if __name__ == "__main__":
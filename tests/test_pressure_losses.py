@@ -8,35 +8,36 @@ Tests friction calculations, fitting losses, and system optimization.
 """
 
 import math
-import os
-import sys
 import unittest
-from unittest.mock import Mock
+from dataclasses import asdict, fields
+from types import SimpleNamespace
 
-# Add src directory to path for imports  # noqa: E402
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
-from pressure_losses import (  # noqa: E402
+import numpy as np
+
+from pressure_losses import (
     PressureLossCalculator,
     PressureLossResults,
     PipeSegment,
     Fitting,
+    _swamee_jain_friction_factor,
 )
-from burner_design import BurnerDesignResults  # noqa: E402
-from combustion import CombustionCalculator  # noqa: E402
+from burner_design import BurnerDesignResults
+from combustion import CombustionCalculator
 
 
 class TestPressureLossCalculator(unittest.TestCase):
     """Test cases for PressureLossCalculator class."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.calculator = PressureLossCalculator()
+    @classmethod
+    def setUpClass(cls):
+        """Set up fixtures shared by all tests; tests treat them as read-only."""
+        cls.calculator = PressureLossCalculator()
 
-        # Create mock combustion calculator
-        self.mock_combustion = Mock(spec=CombustionCalculator)
+        # Only identity matters for the injected combustion calculator
+        cls.mock_combustion = SimpleNamespace()
 
         # Sample pipe segments for testing
-        self.sample_pipe_segments = [
+        cls.sample_pipe_segments = [
             PipeSegment(
                 length=10.0,
                 diameter=0.05,  # 50mm
@@ -54,7 +55,7 @@ class TestPressureLossCalculator(unittest.TestCase):
         ]
 
         # Sample fittings for testing
-        self.sample_fittings = [
+        cls.sample_fittings = [
             Fitting("elbow_90_long", 2, 0.6, 0.05),
             Fitting("gate_valve_open", 1, 0.15, 0.05),
             Fitting("tee_through", 1, 0.2, 0.05),
@@ -62,7 +63,7 @@ class TestPressureLossCalculator(unittest.TestCase):
         ]
 
         # Sample burner results
-        self.sample_burner_results = BurnerDesignResults(
+        cls.sample_burner_results = BurnerDesignResults(
             burner_diameter=0.1,
             burner_area=0.008,
             gas_velocity=20.0,
@@ -73,6 +74,42 @@ class TestPressureLossCalculator(unittest.TestCase):
             flame_length=1.0,
         )
 
+        # One 50mm segment per material for the roughness comparison
+        cls._material_segments = {
+            material: PipeSegment(
+                length=10.0,
+                diameter=0.05,
+                roughness=cls.calculator.get_pipe_roughness(material),
+                material=material,
+            )
+            for material in (
+                "steel_new",
+                "copper",
+                "plastic",
+                "cast_iron",
+                "steel_used",
+            )
+        }
+
+        # Baseline system results at 0.002 kg/s, with and without the burner
+        cls._baseline_result = cls.calculator.calculate_system_pressure_losses(
+            pipe_segments=cls.sample_pipe_segments,
+            fittings=cls.sample_fittings,
+            mass_flow_rate=0.002,  # kg/s
+            gas_density=0.8,  # kg/m³
+            gas_viscosity=1.5e-5,  # Pa·s
+            burner_results=cls.sample_burner_results,
+        )
+        cls._baseline_result_no_burner = (
+            cls.calculator.calculate_system_pressure_losses(
+                pipe_segments=cls.sample_pipe_segments,
+                fittings=cls.sample_fittings,
+                mass_flow_rate=0.002,
+                gas_density=0.8,
+                gas_viscosity=1.5e-5,
+            )
+        )
+
     def test_initialization_default(self):
         """Test default initialization."""
         calc = PressureLossCalculator()
@@ -86,63 +123,85 @@ class TestPressureLossCalculator(unittest.TestCase):
         calc = PressureLossCalculator(
             combustion_calculator=self.mock_combustion, safety_factor=1.5
         )
-        self.assertEqual(calc.combustion_calc, self.mock_combustion)
+        self.assertIs(calc.combustion_calc, self.mock_combustion)
         self.assertEqual(calc.safety_factor, 1.5)
 
     def test_calculate_system_pressure_losses_basic(self):
         """Test basic system pressure loss calculation."""
-        result = self.calculator.calculate_system_pressure_losses(
-            pipe_segments=self.sample_pipe_segments,
-            fittings=self.sample_fittings,
-            mass_flow_rate=0.002,  # kg/s
-            gas_density=0.8,  # kg/m³
-            gas_viscosity=1.5e-5,  # Pa·s
-            burner_results=self.sample_burner_results,
-        )
+        result = self._baseline_result
 
         # Check result type and basic properties
         self.assertIsInstance(result, PressureLossResults)
-        self.assertGreater(result.total_pressure_loss, 0)
-        self.assertGreater(result.friction_losses, 0)
-        self.assertGreater(result.minor_losses, 0)
-        self.assertGreater(result.elevation_losses, 0)
+        np.testing.assert_array_less(
+            0,
+            [
+                result.total_pressure_loss,
+                result.friction_losses,
+                result.minor_losses,
+                result.elevation_losses,
+                result.reynolds_number,
+                result.friction_factor,
+                result.velocity_pressure,
+            ],
+        )
         self.assertEqual(result.burner_pressure_loss, 500.0)
         self.assertGreater(result.required_supply_pressure, result.total_pressure_loss)
-        self.assertGreater(result.reynolds_number, 0)
-        self.assertGreater(result.friction_factor, 0)
-        self.assertGreater(result.velocity_pressure, 0)
 
     def test_calculate_system_pressure_losses_no_burner(self):
         """Test pressure loss calculation without burner results."""
-        result = self.calculator.calculate_system_pressure_losses(
+        result = self._baseline_result_no_burner
+
+        self.assertEqual(result.burner_pressure_loss, 0.0)
+        self.assertGreater(result.total_pressure_loss, 0)
+
+    def test_calculate_system_pressure_losses_flow_rate_scaling(self):
+        """Test that pressure losses scale properly with flow rate."""
+        results = self.calculator.calculate_system_pressure_losses_batch(
             pipe_segments=self.sample_pipe_segments,
             fittings=self.sample_fittings,
-            mass_flow_rate=0.002,
+            mass_flow_rates=[0.001, 0.002, 0.004],  # kg/s
             gas_density=0.8,
             gas_viscosity=1.5e-5,
         )
 
-        self.assertEqual(result.burner_pressure_loss, 0.0)
-        self.assertGreater(result.total_pressure_loss, 0)
+        # Pressure losses should increase with flow rate (approximately as flow²)
+        self.assertTrue(np.all(np.diff(results["total_pressure_loss"]) > 0))
 
-    def test_calculate_system_pressure_losses_flow_rate_scaling(self):
-        """Test that pressure losses scale properly with flow rate."""
-        flow_rates = [0.001, 0.002, 0.004]  # kg/s
-        results = []
+    def test_calculate_system_pressure_losses_batch(self):
+        """Test that batch calculation agrees with individual calls."""
+        # Spans laminar, transition and turbulent flow in both segments
+        flow_rates = np.geomspace(1e-4, 0.05, 50)
 
-        for flow_rate in flow_rates:
-            result = self.calculator.calculate_system_pressure_losses(
-                pipe_segments=self.sample_pipe_segments,
-                fittings=self.sample_fittings,
-                mass_flow_rate=flow_rate,
+        batch = self.calculator.calculate_system_pressure_losses_batch(
+            self.sample_pipe_segments,
+            self.sample_fittings,
+            flow_rates,
+            gas_density=0.8,
+            burner_results=self.sample_burner_results,
+        )
+        singles = [
+            self.calculator.calculate_system_pressure_losses(
+                self.sample_pipe_segments,
+                self.sample_fittings,
+                float(flow_rate),
                 gas_density=0.8,
-                gas_viscosity=1.5e-5,
+                burner_results=self.sample_burner_results,
             )
-            results.append(result)
+            for flow_rate in flow_rates
+        ]
 
-        # Pressure losses should increase with flow rate (approximately as flow²)
-        self.assertLess(results[0].total_pressure_loss, results[1].total_pressure_loss)
-        self.assertLess(results[1].total_pressure_loss, results[2].total_pressure_loss)
+        self.assertEqual(
+            list(batch), [field.name for field in fields(PressureLossResults)]
+        )
+        for field, values in batch.items():
+            with self.subTest(field=field):
+                expected = [getattr(result, field) for result in singles]
+                np.testing.assert_allclose(values, expected, rtol=1e-9)
+
+        with self.assertRaisesRegex(ValueError, "větší než nula"):
+            self.calculator.calculate_system_pressure_losses_batch(
+                self.sample_pipe_segments, self.sample_fittings, [0.002, 0.0], 0.8
+            )
 
     def test_invalid_mass_flow_rate(self):
         """Test validation of invalid mass flow rate."""
@@ -267,6 +326,17 @@ class TestPressureLossCalculator(unittest.TestCase):
 
         self.assertAlmostEqual(lhs, rhs, places=3)
 
+    def test_swamee_jain_friction_factor(self):
+        """Test explicit Swamee-Jain approximation against Colebrook-White."""
+        for reynolds, relative_roughness in ((1e4, 1e-3), (1e5, 1e-5), (1e6, 1e-2)):
+            with self.subTest(reynolds=reynolds, relative_roughness=relative_roughness):
+                f_explicit = _swamee_jain_friction_factor(reynolds, relative_roughness)
+                f_iterative = self.calculator._colebrook_white(
+                    reynolds, relative_roughness
+                )
+
+                self.assertAlmostEqual(f_explicit / f_iterative, 1.0, delta=0.02)
+
     def test_calculate_fitting_loss(self):
         """Test fitting loss calculation."""
         fitting = self.sample_fittings[0]  # elbow_90_long
@@ -410,11 +480,24 @@ class TestPressureLossCalculator(unittest.TestCase):
             elevation_change=2.0,
         )
 
-        self.assertEqual(segment.length, 10.0)
-        self.assertEqual(segment.diameter, 0.05)
-        self.assertEqual(segment.roughness, 0.000045)
-        self.assertEqual(segment.material, "steel_new")
-        self.assertEqual(segment.elevation_change, 2.0)
+        self.assertEqual(
+            asdict(segment),
+            {
+                "length": 10.0,
+                "diameter": 0.05,
+                "roughness": 0.000045,
+                "material": "steel_new",
+                "elevation_change": 2.0,
+            },
+        )
+
+    def test_pipe_segment_to_arrays(self):
+        """Test conversion of pipe segments into column arrays."""
+        arrays = PipeSegment.to_arrays(self.sample_pipe_segments)
+
+        self.assertEqual(list(arrays), [field.name for field in fields(PipeSegment)])
+        np.testing.assert_array_equal(arrays["diameter"], [0.05, 0.025])
+        np.testing.assert_array_equal(arrays["material"], ["steel_new", "steel_new"])
 
     def test_fitting_dataclass(self):
         """Test Fitting dataclass functionality."""
@@ -422,10 +505,15 @@ class TestPressureLossCalculator(unittest.TestCase):
             type="elbow_90_long", quantity=2, loss_coefficient=0.6, diameter=0.05
         )
 
-        self.assertEqual(fitting.type, "elbow_90_long")
-        self.assertEqual(fitting.quantity, 2)
-        self.assertEqual(fitting.loss_coefficient, 0.6)
-        self.assertEqual(fitting.diameter, 0.05)
+        self.assertEqual(
+            asdict(fitting),
+            {
+                "type": "elbow_90_long",
+                "quantity": 2,
+                "loss_coefficient": 0.6,
+                "diameter": 0.05,
+            },
+        )
 
     def test_pressure_loss_results_dataclass(self):
         """Test PressureLossResults dataclass functionality."""
@@ -442,63 +530,47 @@ class TestPressureLossCalculator(unittest.TestCase):
             velocity_pressure=400.0,
         )
 
-        # Test all attributes are accessible
-        self.assertEqual(results.total_pressure_loss, 1000.0)
-        self.assertEqual(results.friction_losses, 600.0)
-        self.assertEqual(results.minor_losses, 200.0)
-        self.assertEqual(results.elevation_losses, 100.0)
-        self.assertEqual(results.burner_pressure_loss, 100.0)
-        self.assertEqual(results.required_supply_pressure, 1300.0)
-        self.assertEqual(results.system_resistance_coefficient, 2.5)
-        self.assertEqual(results.reynolds_number, 5000.0)
-        self.assertEqual(results.friction_factor, 0.025)
-        self.assertEqual(results.velocity_pressure, 400.0)
-
-    def test_edge_case_very_small_pipe(self):
-        """Test calculation with very small pipe diameter."""
-        small_segment = PipeSegment(
-            length=1.0,
-            diameter=0.01,  # 10mm - small diameter
-            roughness=0.000045,
-            material="steel_new",
-        )
-
-        friction_loss, reynolds, friction_factor, velocity_pressure = (
-            self.calculator._calculate_pipe_friction_loss(
-                segment=small_segment,
-                mass_flow_rate=0.0001,  # Small flow rate
-                gas_density=0.8,
-                gas_viscosity=1.5e-5,
-            )
+        # Test all attributes are accessible, in field order
+        np.testing.assert_allclose(
+            [getattr(results, field.name) for field in fields(PressureLossResults)],
+            [1000.0, 600.0, 200.0, 100.0, 100.0, 1300.0, 2.5, 5000.0, 0.025, 400.0],
+            rtol=0,
         )
 
-        # Should still produce valid results
-        self.assertGreater(friction_loss, 0)
-        self.assertGreater(reynolds, 0)
-        self.assertGreater(friction_factor, 0)
+        # Results are immutable
+        with self.assertRaises(AttributeError):
+            results.total_pressure_loss = 0.0
 
-    def test_edge_case_very_large_pipe(self):
-        """Test calculation with very large pipe diameter."""
-        large_segment = PipeSegment(
-            length=10.0,
-            diameter=0.5,  # 500mm - large diameter
-            roughness=0.000045,
-            material="steel_new",
+    def test_edge_case_pipe_sizes(self):
+        """Test calculation with very small and very large pipe diameters."""
+        cases = (
+            # (length [m], diameter [m], mass flow rate [kg/s])
+            (1.0, 0.01, 0.0001),  # 10mm pipe, small flow rate
+            (10.0, 0.5, 0.1),  # 500mm pipe, large flow rate
         )
 
-        friction_loss, reynolds, friction_factor, velocity_pressure = (
-            self.calculator._calculate_pipe_friction_loss(
-                segment=large_segment,
-                mass_flow_rate=0.1,  # Large flow rate
-                gas_density=0.8,
-                gas_viscosity=1.5e-5,
-            )
-        )
+        for length, diameter, mass_flow_rate in cases:
+            with self.subTest(diameter=diameter):
+                segment = PipeSegment(
+                    length=length,
+                    diameter=diameter,
+                    roughness=0.000045,
+                    material="steel_new",
+                )
 
-        # Should still produce valid results
-        self.assertGreater(friction_loss, 0)
-        self.assertGreater(reynolds, 0)
-        self.assertGreater(friction_factor, 0)
+                friction_loss, reynolds, friction_factor, _ = (
+                    self.calculator._calculate_pipe_friction_loss(
+                        segment=segment,
+                        mass_flow_rate=mass_flow_rate,
+                        gas_density=0.8,
+                        gas_viscosity=1.5e-5,
+                    )
+                )
+
+                # Should still produce valid results
+                self.assertGreater(friction_loss, 0)
+                self.assertGreater(reynolds, 0)
+                self.assertGreater(friction_factor, 0)
 
     def test_safety_factor_application(self):
         """Test that safety factor is properly applied."""
@@ -534,44 +606,18 @@ class TestPressureLossCalculator(unittest.TestCase):
 
     def test_different_pipe_materials(self):
         """Test calculations with different pipe materials."""
-        materials = ["steel_new", "copper", "plastic", "cast_iron"]
-        results = []
-
-        for material in materials:
-            segment = PipeSegment(
-                length=10.0,
-                diameter=0.05,
-                roughness=self.calculator.get_pipe_roughness(material),
-                material=material,
-            )
-
-            friction_loss, _, friction_factor, _ = (
-                self.calculator._calculate_pipe_friction_loss(
-                    segment, 0.002, 0.8, 1.5e-5
-                )
-            )
-
-            results.append(
-                {
-                    "material": material,
-                    "friction_loss": friction_loss,
-                    "friction_factor": friction_factor,
-                }
-            )
-
-        # Smoother materials should have lower friction factors and losses
-        smooth_materials = ["copper", "plastic"]
-        rough_materials = ["cast_iron", "steel_used"]
-
-        for smooth in smooth_materials:
-            smooth_result = next(r for r in results if r["material"] == smooth)
-            for rough in rough_materials:
-                if rough in [r["material"] for r in results]:
-                    rough_result = next(r for r in results if r["material"] == rough)
-                    self.assertLess(
-                        smooth_result["friction_factor"],
-                        rough_result["friction_factor"],
-                    )
+        friction_factors = {
+            material: self.calculator._calculate_pipe_friction_loss(
+                segment, 0.002, 0.8, 1.5e-5
+            )[2]
+            for material, segment in self._material_segments.items()
+        }
+
+        # Smoother materials should have lower friction factors
+        for smooth in ("copper", "plastic"):
+            for rough in ("cast_iron", "steel_used"):
+                with self.subTest(smooth=smooth, rough=rough):
+                    self.assertLess(friction_factors[smooth], friction_factors[rough])
 
 
 if __name__ == "__main__":
@@ -8,19 +8,15 @@ Tests Stefan-Boltzmann law applications, view factors, and material properties.
 """
 
 import math
-import os
-import sys
 import unittest
 from unittest.mock import Mock, patch
 
-# Add src directory to path for imports  # noqa: E402
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
-from radiation import (  # noqa: E402
+from radiation import (
     RadiationCalculator,
     RadiationResults,
     SurfaceProperties,
 )
-from combustion import CombustionCalculator  # noqa: E402
+from combustion import CombustionCalculator
 
 
 class TestRadiationCalculator(unittest.TestCase):
@@ -9,13 +9,10 @@ Tests text, CSV, and Excel report generation functionality.
 
 import os
 import shutil
-import sys
 import tempfile
 import unittest
 
-# Add src directory to path for imports  # noqa: E402
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
-from report import BurnerReportGenerator  # noqa: E402
+from report import BurnerReportGenerator
 
 
 class TestBurnerReportGenerator(unittest.TestCase):
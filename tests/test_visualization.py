@@ -9,13 +9,10 @@ Tests chart generation, file saving, and visualization utilities.
 
 import os
 import shutil
-import sys
 import tempfile
 import unittest
 
-# Add src directory to path for imports  # noqa: E402
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
-from visualization import BurnerVisualization  # noqa: E402
+from visualization import BurnerVisualization
 
 
 class TestBurnerVisualization(unittest.TestCase):
@@ -218,9 +215,13 @@ class TestBurnerVisualization(unittest.TestCase):
 
     def test_invalid_output_directory(self):
         """Test handling of invalid output directory."""
-        # Test with directory that cannot be created (permission denied)
+        # A regular file as parent can never become a directory, even for root
+        blocker = os.path.join(self.temp_dir, "blocker")
+        with open(blocker, "w", encoding="utf-8"):
+            pass
+
         with self.assertRaises(OSError):
-            BurnerVisualization(output_dir="/nonexistent/directory")
+            BurnerVisualization(output_dir=os.path.join(blocker, "directory"))
 
     def test_unsupported_format(self):
         """Test handling of unsupported file formats."""